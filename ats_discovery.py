@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+ATS auto-discovery for vanity careers pages, with a persisted resolution cache.
+
+- signature(text) finds an applicant-tracking-system board in a URL or in raw
+  HTML (links, iframes, embed scripts): Workday, iCIMS, BambooHR, Paylocity,
+  JazzHR (applytojob.com), Greenhouse, Lever; the board URL is canonicalized
+  (e.g. Workday locale segments dropped, Greenhouse embeds -> board URL)
+- resolve(url, fetch) checks the URL itself, then the careers page, then a
+  linked single-posting page (e.g. a Paylocity jobs/Details/<id> URL, whose
+  page links back to the company's board), then up to MAX_HOPS same-site
+  "careers / jobs / openings" links found in it; regexes over the raw HTML,
+  no DOM parse
+- Resolutions are kept in .cache/ats_endpoints.json: found boards for TTL,
+  "nothing found" for NEGATIVE_TTL; invalidate(url) after a failed scrape (or
+  a 404 / 410 from the board) makes the next run probe again
+- `python ats_discovery.py [--refresh]` runs the discovery pass over the org
+  registry and prints what each careers page resolved to
+
+Usage:
+    import ats_discovery
+    found = ats_discovery.resolve(url, fetch)   # {"platform": "Greenhouse", "board": "https://..."} or None
+"""
+
+import re
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+
+import link_cache
+
+TTL = 14 * link_cache.DAY
+NEGATIVE_TTL = 2 * link_cache.DAY
+MAX_HOPS = 3
+
+# careers URL -> {"platform": ..., "board": ...}, or {"platform": None} when nothing was found
+RESOLVED = link_cache.open_cache("ats_endpoints", ttl=TTL, max_entries=5000)
+
+stats = {"cached": 0, "probed": 0, "found": 0, "fetches": 0}
+
+# fetch(url) -> (final url, html) or None
+Fetch = Callable[[str], Optional[Tuple[str, str]]]
+
+NOT_A_BOARD = {"www", "app", "api", "embed", "js", "static", "assets", "cdn", "help", "support"}
+
+
+def _workday(m) -> str:
+    host, path = m.group(1), m.group(2)
+    site = next((p for p in path.split("/") if p and not re.fullmatch(r"[a-z]{2}-[A-Z]{2}", p)), "")
+    return f"https://{host}/{site}" if site else ""
+
+
+# (platform, pattern, canonical board URL from the match); first match wins
+SIGNATURES = [
+    ("Workday", re.compile(r"https?://([a-z0-9-]+(?:\.wd\d+)?\.myworkdayjobs\.com)((?:/[\w-]+){1,2})"),
+     _workday),
+    ("Greenhouse", re.compile(r"(?:boards|job-boards)\.greenhouse\.io/(?:embed/job_board(?:/js)?\?for=)?([\w-]+)", re.I),
+     lambda m: f"https://boards.greenhouse.io/{m.group(1)}"),
+    ("Greenhouse", re.compile(r"boards-api\.greenhouse\.io/v1/boards/([\w-]+)", re.I),
+     lambda m: f"https://boards.greenhouse.io/{m.group(1)}"),
+    ("Lever", re.compile(r"(?:jobs\.lever\.co|api\.lever\.co/v0/postings)/([\w.-]+)", re.I),
+     lambda m: f"https://jobs.lever.co/{m.group(1)}"),
+    ("JazzHR", re.compile(r"([\w-]+)\.applytojob\.com", re.I),
+     lambda m: f"https://{m.group(1).lower()}.applytojob.com/apply"),
+    ("Paylocity", re.compile(r"recruiting\.paylocity\.com/recruiting/(?:jobs/all/([0-9a-f-]{36})"
+                             r"|api/v2/companies/(\d+))", re.I),
+     lambda m: (f"https://recruiting.paylocity.com/recruiting/jobs/All/{m.group(1).lower()}" if m.group(1)
+                else f"https://recruiting.paylocity.com/recruiting/api/v2/companies/{m.group(2)}/jobs")),
+    ("BambooHR", re.compile(r"([\w-]+)\.bamboohr\.com", re.I),
+     lambda m: f"https://{m.group(1).lower()}.bamboohr.com/careers"),
+    ("iCIMS", re.compile(r"([\w-]+\.icims\.com)", re.I),
+     lambda m: f"https://{m.group(1).lower()}/jobs/search"),
+]
+
+# One posting, not a board: the posting's page links to the company's board
+POSTING_RE = re.compile(r"https?://recruiting\.paylocity\.com/recruiting/jobs/details/\d+[^\s\"'<>#]*", re.I)
+
+HREF_RE = re.compile(r"""<a\b[^>]*?href\s*=\s*["']([^"'#]+)[^"']*["'][^>]*>(.*?)</a>""", re.I | re.S)
+CAREER_LINK_RE = re.compile(r"career|jobs?\b|job-|opening|employment|join|work-with|positions|vacanc", re.I)
+
+
+def signature(text: str) -> Optional[Dict[str, str]]:
+    """First ATS board referenced in `text` (a URL or a page), canonicalized."""
+    for platform, pattern, board in SIGNATURES:
+        for m in pattern.finditer(text):
+            if m.group(1) and m.group(1).split(".")[0].lower() in NOT_A_BOARD:
+                continue
+            url = board(m)
+            if url:
+                return {"platform": platform, "board": url}
+    return None
+
+
+def career_links(base: str, html: str) -> List[str]:
+    """Same-site links that look like a careers / openings page, in page order."""
+    host = urlparse(base).hostname
+    links = []
+    for href, label in HREF_RE.findall(html):
+        url = urljoin(base, href.strip())
+        if urlparse(url).hostname != host or url.rstrip("/") == base.rstrip("/") or url in links:
+            continue
+        if CAREER_LINK_RE.search(href) or CAREER_LINK_RE.search(label):
+            links.append(url)
+    return links
+
+
+def probe(url: str, fetch: Fetch, hops: int = MAX_HOPS) -> Optional[Dict[str, str]]:
+    found = signature(url)
+    if found:
+        return found
+    stats["fetches"] += 1
+    page = fetch(url)
+    if not page:
+        return None
+    final, html = page
+    found = signature(final) or signature(html)
+    if found:
+        return found
+    postings = [m.group(0) for m in POSTING_RE.finditer(html)][:1]
+    for link in postings + career_links(final, html)[:hops]:
+        stats["fetches"] += 1
+        sub = fetch(link)
+        if sub:
+            found = signature(sub[0]) or signature(sub[1])
+            if found:
+                return found
+    return None
+
+
+def resolve(url: str, fetch: Fetch, refresh: bool = False) -> Optional[Dict[str, str]]:
+    """ATS board behind careers page `url` (cached), or None."""
+    if not refresh:
+        cached = RESOLVED.get(url)
+        if cached is not None and (cached.get("platform") or time.time() - cached.get("checked", 0) < NEGATIVE_TTL):
+            stats["cached"] += 1
+            return {"platform": cached["platform"], "board": cached["board"]} if cached.get("platform") else None
+
+    stats["probed"] += 1
+    found = probe(url, fetch)
+    if found:
+        stats["found"] += 1
+        RESOLVED.put(url, {**found, "checked": time.time()})
+    else:
+        RESOLVED.put(url, {"platform": None, "board": None, "checked": time.time()})
+    return found
+
+
+def invalidate(url: str):
+    """Forget `url`'s resolution so the next run probes the careers page again."""
+    with RESOLVED.lock:
+        if RESOLVED.entries.pop(url, None) is not None:
+            RESOLVED.dirty = True
+
+
+def report() -> Dict[str, int]:
+    return dict(stats)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    import org_registry
+    import paginate
+    import scraper
+
+    p = argparse.ArgumentParser(description="Resolve each org's careers page to its ATS board")
+    p.add_argument("workbook", nargs="?", default=org_registry.WORKBOOK)
+    p.add_argument("--refresh", action="store_true", help="ignore cached resolutions")
+    p.add_argument("--workers", type=int, default=8)
+    args = p.parse_args(argv)
+
+    orgs = org_registry.load(args.workbook)
+    urls = list(dict.fromkeys(o["url"] for o in orgs))
+    results = dict(paginate.stream(lambda u: resolve(u, scraper.fetch_page, args.refresh),
+                                   urls, workers=args.workers))
+    for o in orgs:
+        found = results.get(o["url"])
+        print(f"{'🎯' if found else '·'} {o['org'][:45]:<45} "
+              + (f"{found['platform']:<10} {found['board']}" if found else scraper.detect_platform(o["url"])))
+    print(f"\n✅ {sum(1 for f in results.values() if f)}/{len(urls)} careers pages resolved to an ATS board ({report()})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
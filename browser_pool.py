@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Shared pool of warm headless Chrome instances for the Selenium scrapers.
+
+- Up to `size` browsers, started lazily and reused across scrapers; the
+  chromedriver binary is resolved once per process, not once per site
+- lease() hands out a fresh tab on a healthy browser and closes it afterwards;
+  a browser that cannot open the tab is retired and a replacement tried once
+- Health check before every lease; a browser is recycled after `max_pages`
+  leases or when Chrome + chromedriver use more than `max_rss_mb`
+  (memory cap needs the optional psutil package)
+- All browsers are quit at interpreter exit, so nothing is left detached
+
+Usage:
+    import browser_pool
+    with browser_pool.lease() as driver:
+        driver.get(url)
+
+Pool size / recycling can be tuned with CJB_BROWSERS, CJB_BROWSER_PAGES,
+CJB_BROWSER_RSS_MB; CJB_HEADFUL=1 shows the windows for debugging.
+CJB_FAST=1 turns on resource blocking (images, fonts, media, trackers) for
+pages opened through page_ready.goto(); see fast_mode.py.
+"""
+
+import atexit
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import psutil
+except ImportError:  # memory cap is skipped without it
+    psutil = None
+
+DEFAULT_SIZE = int(os.environ.get("CJB_BROWSERS", "2"))
+DEFAULT_MAX_PAGES = int(os.environ.get("CJB_BROWSER_PAGES", "200"))
+DEFAULT_MAX_RSS_MB = int(os.environ.get("CJB_BROWSER_RSS_MB", "1500"))
+DEFAULT_FAST = os.environ.get("CJB_FAST") == "1"
+PAGE_LOAD_TIMEOUT = 30
+
+
+@lru_cache(maxsize=1)
+def driver_path() -> Optional[str]:
+    """chromedriver path, resolved once. None lets Selenium Manager find it."""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        return ChromeDriverManager().install()
+    except Exception:
+        return None
+
+
+def chrome_options(headless: bool = True):
+    # selenium is imported on first use, so importing this module stays cheap
+    from selenium.webdriver.chrome.options import Options
+    o = Options()
+    if headless:
+        o.add_argument("--headless=new")
+    o.add_argument("--disable-gpu")
+    o.add_argument("--no-sandbox")
+    o.add_argument("--disable-dev-shm-usage")
+    o.add_argument("--disable-blink-features=AutomationControlled")
+    o.add_argument("--window-size=1280,800")
+    return o
+
+
+class PooledBrowser:
+    def __init__(self, headless: bool = True, fast: bool = False):
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        path = driver_path()
+        service = Service(path) if path else Service()
+        self.driver = webdriver.Chrome(service=service, options=chrome_options(headless))
+        self.driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
+        self.driver.cjb_fast = fast   # read by fast_mode.apply()
+        self.home = self.driver.current_window_handle
+        self.pages = 0
+
+    def healthy(self) -> bool:
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def rss_mb(self) -> Optional[float]:
+        if psutil is None:
+            return None
+        try:
+            root = psutil.Process(self.driver.service.process.pid)
+            procs = [root] + root.children(recursive=True)
+            return sum(p.memory_info().rss for p in procs) / (1024 * 1024)
+        except Exception:
+            return None
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    def __init__(self, size: int = DEFAULT_SIZE, max_pages: int = DEFAULT_MAX_PAGES,
+                 max_rss_mb: int = DEFAULT_MAX_RSS_MB, headless: bool = True, fast: bool = DEFAULT_FAST):
+        self.size = max(1, size)
+        self.max_pages = max_pages
+        self.max_rss_mb = max_rss_mb
+        self.headless = headless
+        self.fast = fast
+        self.idle: "queue.Queue[PooledBrowser]" = queue.Queue()
+        self.all: List[PooledBrowser] = []
+        self.lock = threading.Lock()
+        self.stats = {"started": 0, "recycled": 0, "leases": 0}
+
+    def _acquire(self) -> PooledBrowser:
+        while True:
+            try:
+                return self.idle.get_nowait()
+            except queue.Empty:
+                pass
+            with self.lock:
+                grow = len(self.all) < self.size
+                if grow:
+                    self.all.append(None)   # reserve the slot while Chrome starts
+            if grow:
+                try:
+                    b = PooledBrowser(self.headless, self.fast)
+                except Exception:
+                    with self.lock:
+                        self.all.remove(None)
+                    raise
+                with self.lock:
+                    self.all[self.all.index(None)] = b
+                    self.stats["started"] += 1
+                return b
+            try:
+                # re-check now and then: a retired browser frees a slot
+                return self.idle.get(timeout=1)
+            except queue.Empty:
+                continue
+
+    def _retire(self, b: PooledBrowser):
+        b.quit()
+        with self.lock:
+            if b in self.all:
+                self.all.remove(b)
+            self.stats["recycled"] += 1
+
+    def _worn_out(self, b: PooledBrowser) -> bool:
+        if b.pages >= self.max_pages:
+            return True
+        rss = b.rss_mb()
+        return rss is not None and rss > self.max_rss_mb
+
+    @contextmanager
+    def lease(self):
+        """Yield a WebDriver focused on a fresh tab of a pooled browser."""
+        for attempt in range(2):
+            b = self._acquire()
+            while not b.healthy():
+                self._retire(b)
+                b = self._acquire()
+            try:
+                b.driver.switch_to.new_window("tab")
+                break
+            except Exception:
+                # e.g. chromedriver died after the health check: free the slot
+                # (so a new browser can start) rather than leaking it
+                self._retire(b)
+                if attempt:
+                    raise
+        with self.lock:
+            self.stats["leases"] += 1
+        try:
+            yield b.driver
+        finally:
+            b.pages += 1
+            try:
+                b.driver.close()
+                b.driver.switch_to.window(b.home)
+            except Exception:
+                pass
+            if not b.healthy() or self._worn_out(b):
+                self._retire(b)
+            else:
+                self.idle.put(b)
+
+    def close(self):
+        with self.lock:
+            browsers, self.all = self.all, []
+        for b in browsers:
+            if b is not None:
+                b.quit()
+
+
+_pool: Optional[BrowserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_pool() -> BrowserPool:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool(headless=os.environ.get("CJB_HEADFUL") != "1")
+        return _pool
+
+
+def lease():
+    return get_pool().lease()
+
+
+@atexit.register
+def close_all():
+    if _pool is not None:
+        _pool.close()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+cjb: one entry point for the jobs-board pipeline.
+
+    ./cjb.py scrape [--concurrency 8 ...]   spreadsheet pipeline (scraper.py options)
+    ./cjb.py scrape --site acton ntu        just those scraper plugins, in-process
+    ./cjb.py merge                          TM + YAF -> frontend/public/jobs.json
+    ./cjb.py bench [pages...]               HTML parser backends over saved pages
+    ./cjb.py bench --imports [modules...]   import cost per module (-X importtime)
+    ./cjb.py serve [--port 8000]            serve frontend/build (or public) locally
+
+- Heavy dependencies are imported only inside the command that needs them:
+  merge never loads pandas, requests, bs4 or selenium; pandas is only
+  imported when the spreadsheet is read, selenium only when Chrome starts
+- --timing prints this invocation's startup / import / run cost
+"""
+
+import time
+
+STARTED = time.perf_counter()
+
+import argparse
+import os
+import subprocess
+import sys
+from typing import List, Optional, Tuple
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+IMPORT_TARGETS = ["scraper", "plugin_host", "merge_jobs", "html_parser", "browser_pool", "pandas"]
+
+
+# ---------------- Commands ----------------
+def cmd_scrape(args, rest: List[str]):
+    if args.site:
+        import plugin_host
+        plugin_host.run_all(args.site, jobs=args.jobs)
+    else:
+        import scraper
+        scraper.main(rest)
+
+
+def cmd_merge(args, rest: List[str]):
+    import merge_jobs
+    merge_jobs.merge()
+
+
+def cmd_bench(args, rest: List[str]):
+    if args.imports:
+        print_import_costs(rest or IMPORT_TARGETS)
+        return
+    import html_parser
+    return html_parser.main(rest)
+
+
+def cmd_serve(args, rest: List[str]):
+    from functools import partial
+    from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+    build = os.path.join(ROOT, "frontend", "build")
+    directory = build if os.path.isdir(build) else os.path.join(ROOT, "frontend", "public")
+    server = ThreadingHTTPServer(("127.0.0.1", args.port), partial(SimpleHTTPRequestHandler, directory=directory))
+    print(f"🌐 Serving {os.path.relpath(directory, ROOT)} on http://127.0.0.1:{args.port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# ---------------- Import cost ----------------
+def _importtime(code: str) -> List[Tuple[float, str]]:
+    """[(cumulative ms, top-level package)] from `python -X importtime -c code`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                          cwd=ROOT, capture_output=True, text=True)
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if "." not in name:
+            rows.append((int(cumulative) / 1000, name.strip()))
+    return rows
+
+
+def import_cost(module: str) -> Tuple[float, List[Tuple[float, str]]]:
+    """(total ms, [(cumulative ms, package)] heaviest first) for `import module` in a fresh interpreter."""
+    startup = {name for _, name in _importtime("pass")}   # site, encodings, ...: paid by every run
+    rows = [(ms, name) for ms, name in _importtime(f"import {module}") if name not in startup]
+    own = next((ms for ms, name in reversed(rows) if name == module), 0.0)
+    return own, sorted(rows, reverse=True)
+
+
+def print_import_costs(modules: List[str]):
+    for module in modules:
+        total, rows = import_cost(module)
+        heavy = ", ".join(f"{name} {ms:.0f}ms" for ms, name in rows if name != module and ms >= 20)
+        print(f"📦 {module:<14} {total:>8.1f}ms" + (f"   ({heavy})" if heavy else ""))
+
+
+# ---------------- CLI ----------------
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="cjb", description="Conservative Jobs Board pipeline")
+    p.add_argument("--timing", action="store_true", help="print startup / import / run time")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    s = sub.add_parser("scrape", help="run the spreadsheet pipeline or selected plugins")
+    s.add_argument("--site", nargs="+", help="plugin names (e.g. acton ntu) instead of the spreadsheet")
+    s.add_argument("--jobs", "-j", type=int, default=4, help="plugins to run at once with --site")
+    s.set_defaults(func=cmd_scrape)
+
+    m = sub.add_parser("merge", help="merge TM + YAF into frontend/public/jobs.json")
+    m.set_defaults(func=cmd_merge)
+
+    b = sub.add_parser("bench", help="parser benchmark, or import cost with --imports")
+    b.add_argument("--imports", action="store_true", help="report import time per module")
+    b.set_defaults(func=cmd_bench)
+
+    v = sub.add_parser("serve", help="serve the frontend locally")
+    v.add_argument("--port", type=int, default=8000)
+    v.set_defaults(func=cmd_serve)
+    return p
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args, rest = build_parser().parse_known_args(argv)
+    ready = time.perf_counter()
+    modules_before = len(sys.modules)
+
+    code = args.func(args, rest) or 0
+
+    if args.timing:
+        done = time.perf_counter()
+        print(f"⏱️  startup {(ready - STARTED) * 1000:.0f}ms, {args.command} {(done - ready) * 1000:.0f}ms, "
+              f"{len(sys.modules) - modules_before} modules imported on demand")
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Fast posting-date normalization to YYYY-MM-DD.
+
+- Format-sniffing fast paths, no pandas:
+    ISO dates / datetimes (Workday, WordPress, Paylocity createdDate,
+    with or without a UTC offset; offsets are converted to UTC),
+    "January 5, 2025" / "Jan 5, 2025" (WordPress <time>), "1/5/2025",
+    "Posted Today" / "Posted Yesterday" / "Posted 3 Days Ago" (Workday)
+- Anything else goes through dateutil once; results are memoized, since the
+  same few strings repeat across a run
+- Numbers are only read as Unix timestamps (UTC), in seconds or
+  milliseconds, when epoch-sized; other non-string values become None
+- normalize_many() / normalize_jobs() work on whole lists, parsing each
+  distinct value once
+- Unparseable values ("N/A", "", garbage) become None, never a raw string
+"""
+
+import re
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional
+
+ISO_DATE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})$")
+ISO_DATETIME_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})[T ](\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?)\s*(Z|[+-]\d{2}:?\d{2})?$")
+MONTH_NAME_RE = re.compile(r"^([A-Za-z]{3,9})\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})$")
+US_DATE_RE = re.compile(r"^(\d{1,2})/(\d{1,2})/(\d{4})$")
+RELATIVE_RE = re.compile(r"^(?:posted\s+)?(today|yesterday|(\d+)\+?\s+days?\s+ago)$", re.I)
+
+MONTHS = {m: i for i, m in enumerate(
+    ["jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec"], start=1)}
+
+MISSING = {"", "n/a", "na", "none", "null", "-", "tbd"}
+
+# epoch-sized numbers (2001-09-09 .. 2286-11-20): seconds, or milliseconds (Lever, Greenhouse)
+EPOCH_SECONDS = (10 ** 9, 10 ** 10)
+EPOCH_MILLIS = (10 ** 12, 10 ** 13)
+
+
+def _ymd(y: int, m: int, d: int) -> Optional[str]:
+    try:
+        return date(y, m, d).isoformat()
+    except ValueError:
+        return None
+
+
+def _slow(s: str) -> Optional[str]:
+    try:
+        from dateutil import parser
+    except ImportError:
+        return None
+    try:
+        dt = parser.parse(s)
+    except (ValueError, OverflowError):
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc)
+    return dt.strftime("%Y-%m-%d")
+
+
+@lru_cache(maxsize=8192)
+def _normalize(s: str) -> Optional[str]:
+    if s.lower() in MISSING:
+        return None
+
+    m = ISO_DATE_RE.match(s)
+    if m:
+        return _ymd(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+
+    m = ISO_DATETIME_RE.match(s)
+    if m:
+        if not m.group(5):
+            return _ymd(int(m.group(1)), int(m.group(2)), int(m.group(3)))
+        try:
+            dt = datetime.fromisoformat(s.replace(" ", "T", 1))
+        except ValueError:
+            return _slow(s)
+        return dt.astimezone(timezone.utc).strftime("%Y-%m-%d")
+
+    m = MONTH_NAME_RE.match(s)
+    if m and m.group(1)[:3].lower() in MONTHS:
+        return _ymd(int(m.group(3)), MONTHS[m.group(1)[:3].lower()], int(m.group(2)))
+
+    m = US_DATE_RE.match(s)
+    if m:
+        return _ymd(int(m.group(3)), int(m.group(1)), int(m.group(2)))
+
+    if RELATIVE_RE.match(s):
+        return None   # relative: depends on today, handled outside the memo
+
+    return _slow(s)
+
+
+def _relative(s: str) -> Optional[str]:
+    m = RELATIVE_RE.match(s)
+    if not m:
+        return None
+    word = m.group(1).lower()
+    days = 0 if word == "today" else 1 if word == "yesterday" else int(m.group(2))
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def _epoch(n) -> Optional[str]:
+    if EPOCH_MILLIS[0] <= n < EPOCH_MILLIS[1]:
+        n = n / 1000
+    elif not EPOCH_SECONDS[0] <= n < EPOCH_SECONDS[1]:
+        return None
+    return datetime.fromtimestamp(n, tz=timezone.utc).strftime("%Y-%m-%d")
+
+
+def normalize(value) -> Optional[str]:
+    """YYYY-MM-DD for a posting date in any supported format, else None."""
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return _epoch(value)
+    if not isinstance(value, str):
+        return None
+    s = value.strip()
+    return _normalize(s) or _relative(s)
+
+
+def normalize_many(values: Iterable) -> List[Optional[str]]:
+    """normalize() over a list, parsing each distinct value once."""
+    values = list(values)
+    seen: Dict = {}
+    keys = [v if isinstance(v, (str, type(None))) else (type(v), repr(v)) for v in values]
+    for v, key in zip(values, keys):
+        if key not in seen:
+            seen[key] = normalize(v)
+    return [seen[key] for key in keys]
+
+
+def normalize_jobs(jobs: List[Dict], field: str = "date_posted") -> List[Dict]:
+    """Rewrite `field` on every job that has it to YYYY-MM-DD or None."""
+    having = [j for j in jobs if field in j]
+    for job, value in zip(having, normalize_many(j[field] for j in having)):
+        job[field] = value
+    return jobs
+
+
+def cache_info():
+    return _normalize.cache_info()
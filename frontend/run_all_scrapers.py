@@ -1,5 +1,8 @@
 import os
-import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import scraper_runner
 
 # All scraper filenames in frontend/
 SCRAPERS = [
@@ -24,22 +27,22 @@ SCRAPERS = [
     "scraper_acc.py",
 ]
 
-def run_scrapers():
+def run_scrapers(argv=None):
+    args = scraper_runner.parse_args(argv)
     base = os.getcwd()
 
     print("\n=== Running ALL Job Scrapers ===\n")
 
+    paths = []
     for script in SCRAPERS:
         path = os.path.join(base, script)
         if os.path.exists(path):
-            print(f"\n--- Running {script} ---")
-            try:
-                subprocess.run(["python3", path], check=False)
-            except Exception as e:
-                print(f"Error running {script}: {e}")
+            paths.append(path)
         else:
             print(f"Skipping {script} (not found)")
 
+    scraper_runner.run_many(paths, base, jobs=args.jobs, timeout=args.timeout, report_path=args.report)
+
     print("\n=== ALL SCRAPERS FINISHED ===\n")
 
 if __name__ == "__main__":
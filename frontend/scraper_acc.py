@@ -1,13 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
 
 URL = "https://acc.eco/careers/"
 OUTPUT = "public/jobs_acc.json"
 
-def scrape_acc():
-    resp = requests.get(URL, timeout=15)
-    soup = BeautifulSoup(resp.text, "html.parser")
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+def parse_acc(html):
+    soup = html_parser.parse(html, only=["article.job-card"], label="acc")
 
     jobs = []
 
@@ -25,6 +33,18 @@ def scrape_acc():
             "type": "N/A"
         })
 
+    return jobs
+
+
+def scrape():
+    ratelimit.wait(URL)
+    resp = session.get(URL, timeout=15)
+    return page_digest.reuse_or_parse(URL, resp.text, parse_acc)
+
+
+def scrape_acc():
+    jobs = scrape()
+
     with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
 
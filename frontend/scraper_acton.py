@@ -1,17 +1,46 @@
 import requests
-from bs4 import BeautifulSoup
 import json
 import os
+import sys
 
-def scrape_acton():
-    url = "https://www.acton.org/careers"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
+
+URL = "https://www.acton.org/careers"
+OUTPUT = "public/jobs_acton.json"
+
+# job cards; only these subtrees of the page are parsed
+CARDS = "ul.careers-listing__internships li.opening"
+
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+def scrape():
     print("Requesting Acton careers page...")
 
-    response = requests.get(url, headers={"User-Agent": "Mozilla/5.0"})
-    soup = BeautifulSoup(response.text, "html.parser")
+    ratelimit.wait(URL)
+    response = session.get(URL, headers={"User-Agent": "Mozilla/5.0"})
+    return page_digest.reuse_or_parse(URL, response.text, parse_acton)
+
+
+def scrape_acton():
+    jobs = scrape()
+
+    # save
+    output_path = OUTPUT
+    with open(output_path, "w") as f:
+        json.dump(jobs, f, indent=2)
+
+    print(f"Saved {len(jobs)} Acton jobs to {output_path}")
+
+
+def parse_acton(html):
+    soup = html_parser.parse(html, only=[CARDS], label="acton")
 
     jobs = []
-    cards = soup.select("ul.careers-listing__internships li.opening")
+    cards = soup.select(CARDS)
 
     print(f"Found {len(cards)} Acton job cards")
 
@@ -38,12 +67,7 @@ def scrape_acton():
             "link": link
         })
 
-    # save
-    output_path = os.path.join("public", "jobs_acton.json")
-    with open(output_path, "w") as f:
-        json.dump(jobs, f, indent=2)
-
-    print(f"Saved {len(jobs)} Acton jobs to {output_path}")
+    return jobs
 
 
 if __name__ == "__main__":
@@ -1,13 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
 
 URL = "https://americafirstpolicy.com/careers"
 OUTPUT_FILE = "frontend/public/jobs_afpi.json"
 
-def scrape_afpi():
-    response = requests.get(URL, timeout=10)
-    soup = BeautifulSoup(response.text, "html.parser")
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+def parse_afpi(html):
+    soup = html_parser.parse(html, only=["a.career"], label="afpi")
 
     jobs = []
 
@@ -36,6 +44,16 @@ def scrape_afpi():
 
         jobs.append(job_entry)
 
+    return jobs
+
+def scrape():
+    ratelimit.wait(URL)
+    response = session.get(URL, timeout=10)
+    return page_digest.reuse_or_parse(URL, response.text, parse_afpi)
+
+def scrape_afpi():
+    jobs = scrape()
+
     with open(OUTPUT_FILE, "w") as f:
         json.dump(jobs, f, indent=2)
 
@@ -1,15 +1,29 @@
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
+import wp_json
+from tm_org_extract import org_from_html
+
+URL = "https://talentmarket.org/job-listings/"
+SITE = "https://talentmarket.org"
+OUTPUT = "public/jobs_aier.json"
+CAREERS = "https://www.aier.org/careers/"
+
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
 
 # Convert ALL CAPS to Title Case (consistent with Acton rule)
 def to_title_case(text):
     return " ".join([word.capitalize() for word in text.lower().split()])
 
-def scrape_aier():
-    url = "https://talentmarket.org/job-listings/"
-    response = requests.get(url)
-    soup = BeautifulSoup(response.text, "html.parser")
+def parse_aier(html):
+    soup = html_parser.parse(html, only=[".wpjb-job"], label="aier")
 
     jobs = []
 
@@ -23,7 +37,7 @@ def scrape_aier():
         org_name = org.get_text(strip=True)
 
         # Only capture AIER jobs
-        if "aier" in org_name.lower() or "american institute for economic research" in org_name.lower():
+        if is_aier(org_name):
 
             title_el = job.select_one(".wpjb-job-title a")
             loc_el = job.select_one(".wpjb-job-location")
@@ -36,8 +50,8 @@ def scrape_aier():
 
             location = loc_el.get_text(strip=True) if loc_el else ""
 
-            # RULE: ALWAYS link to AIER homepage
-            aier_link = "https://www.aier.org/careers/"
+            # the posting itself; AIER's careers page only when the card has no link
+            aier_link = title_el.get("href") or CAREERS
 
             jobs.append({
                 "title": title,
@@ -47,10 +61,49 @@ def scrape_aier():
                 "type": ""   # filled manually later
             })
 
-    with open("public/jobs_aier.json", "w") as f:
+    return jobs
+
+def is_aier(org_name):
+    return "aier" in org_name.lower() or "american institute for economic research" in org_name.lower()
+
+def scrape_api():
+    """AIER postings from Talent Market's REST API, or None when it is not exposed."""
+    posts = wp_json.jobs(session, SITE, "jobs")
+    if posts is None:
+        return None
+
+    jobs = []
+    for post in posts:
+        org_name = post["organization"] or org_from_html(post["html"]) or ""
+        if not is_aier(org_name):
+            continue
+        jobs.append({
+            "title": to_title_case(post["title"]),
+            "company": "American Institute for Economic Research (AIER)",
+            "location": post["location"] or "",
+            "url": post["link"] or CAREERS,
+            "type": ""
+        })
+    return jobs
+
+def scrape():
+    # one JSON request instead of the full listing page; HTML when there is no API
+    jobs = scrape_api()
+    if jobs is not None:
+        return jobs
+
+    ratelimit.wait(URL)
+    response = session.get(URL)
+    return page_digest.reuse_or_parse(URL, response.text, parse_aier)
+
+def scrape_aier():
+    jobs = scrape()
+
+    with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
 
-    print("AIER jobs saved to public/jobs_aier.json")
+    print(f"AIER jobs saved to {OUTPUT}")
 
-scrape_aier()
+if __name__ == "__main__":
+    scrape_aier()
 
@@ -1,17 +1,20 @@
 import requests
-from bs4 import BeautifulSoup
 import os
+import sys
 import json
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
+
 URL = "https://alec.org/job-opportunities/"
 
-def scrape_alec():
-    try:
-        html = requests.get(URL, timeout=15).text
-        soup = BeautifulSoup(html, "html.parser")
-    except Exception as e:
-        print("Error fetching ALEC page:", e)
-        return
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+def parse_alec(html):
+    soup = html_parser.parse(html, only=["ul.media-list li"], label="alec")
 
     jobs = []
 
@@ -32,6 +35,20 @@ def scrape_alec():
             "type": "N/A"
         })
 
+    return jobs
+
+def scrape():
+    ratelimit.wait(URL)
+    html = session.get(URL, timeout=15).text
+    return page_digest.reuse_or_parse(URL, html, parse_alec)
+
+def scrape_alec():
+    try:
+        jobs = scrape()
+    except Exception as e:
+        print("Error fetching ALEC page:", e)
+        return
+
     # Save JSON in frontend/public/
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_path = os.path.join(script_dir, "public", "jobs_alec.json")
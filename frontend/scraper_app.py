@@ -1,12 +1,21 @@
 import json
+import os
+import sys
 import requests
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
 
 URL = "https://americanprinciplesproject.org/careers/"
 OUTPUT = "public/jobs_app.json"
 
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
 
-def scrape_app():
+
+def scrape():
     print("Fetching APP job postings...")
 
     headers = {
@@ -18,10 +27,26 @@ def scrape_app():
         "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
     }
 
-    resp = requests.get(URL, headers=headers, timeout=20)
+    ratelimit.wait(URL)
+    resp = session.get(URL, headers=headers, timeout=20)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "lxml")
+    return page_digest.reuse_or_parse(URL, resp.text, parse_app)
+
+
+def scrape_app():
+    jobs = scrape()
+
+    print(f"Found {len(jobs)} APP jobs")
+    # Make sure the output directory exists and write JSON
+    with open(OUTPUT, "w") as f:
+        json.dump(jobs, f, indent=2)
+
+    print(f"Saved to {OUTPUT}")
+
+
+def parse_app(html):
+    soup = html_parser.parse(html)
 
     main = soup.find("div", id="main-careers")
     if not main:
@@ -56,12 +81,7 @@ def scrape_app():
             }
             jobs.append(job)
 
-    print(f"Found {len(jobs)} APP jobs")
-    # Make sure the output directory exists and write JSON
-    with open(OUTPUT, "w") as f:
-        json.dump(jobs, f, indent=2)
-
-    print(f"Saved to {OUTPUT}")
+    return jobs
 
 
 if __name__ == "__main__":
@@ -1,17 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
 import os
+import sys
 import json
 
-def scrape_crc_internships():
-    URL = "https://capitalresearch.org/about/internships/"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
 
-    try:
-        html = requests.get(URL, timeout=15).text
-        soup = BeautifulSoup(html, "html.parser")
-    except Exception as e:
-        print("Error fetching CRC page:", e)
-        return
+URL = "https://capitalresearch.org/about/internships/"
+OUTPUT = "public/jobs_crc.json"
+
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+def parse_crc_internships(html):
+    soup = html_parser.parse(html)
 
     internships = []
 
@@ -27,6 +31,20 @@ def scrape_crc_internships():
                 "type": "N/A"
             })
 
+    return internships
+
+def scrape():
+    ratelimit.wait(URL)
+    html = session.get(URL, timeout=15).text
+    return page_digest.reuse_or_parse(URL, html, parse_crc_internships)
+
+def scrape_crc_internships():
+    try:
+        internships = scrape()
+    except Exception as e:
+        print("Error fetching CRC page:", e)
+        return
+
     # Safe path resolution
     script_dir = os.path.dirname(os.path.abspath(__file__))
     output_path = os.path.join(script_dir, "public", "jobs_crc.json")
@@ -1,14 +1,25 @@
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
+import wp_json
 
 BASE_URL = "https://excelined.org/job-opportunities/"
+OUTPUT = "public/jobs_excelined.json"
 
-def scrape_excelined():
-    response = requests.get(BASE_URL, timeout=15)
-    soup = BeautifulSoup(response.text, "html.parser")
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
 
-    jobs = []
+def parse_listing(html):
+    """Return [title, url] pairs from the job-opportunities page."""
+    soup = html_parser.parse(html, only=[".the-resource"], label="excelined")
+
+    postings = []
 
     # Find the container with all job postings
     job_blocks = soup.select(".the-resource")
@@ -20,20 +31,46 @@ def scrape_excelined():
         if not title_el or not link_el:
             continue
 
-        title = title_el.get_text(strip=True)
-        url = link_el["href"]
+        postings.append([title_el.get_text(strip=True), link_el["href"]])
+
+    return postings
+
+def parse_description(html):
+    detail_soup = html_parser.parse(html, only=[".gutenberg"], label="excelined detail")
+
+    # Gutenberg content container
+    desc_container = detail_soup.select_one(".gutenberg")
+    return desc_container.get_text(" ", strip=True) if desc_container else ""
+
+def scrape():
+    # with the REST API, title, link and description come in one response
+    posts = wp_json.jobs(session, BASE_URL)
+    if posts:
+        return [{
+            "title": post["title"],
+            "company": "ExcelinEd (Foundation for Excellence in Education)",
+            "location": post["location"] or "",
+            "url": post["link"],
+            "type": "",
+            "description": post["text"]
+        } for post in posts]
+
+    ratelimit.wait(BASE_URL)
+    response = session.get(BASE_URL, timeout=15)
+    # unchanged pages reuse last run's extraction instead of re-parsing
+    postings = page_digest.reuse_or_parse(BASE_URL, response.text, parse_listing)
+
+    jobs = []
+
+    for title, url in postings:
         company = "ExcelinEd (Foundation for Excellence in Education)"
 
         # Step 1: fetch job detail page to extract description
         desc_text = ""
         try:
-            job_detail = requests.get(url, timeout=15)
-            detail_soup = BeautifulSoup(job_detail.text, "html.parser")
-
-            # Gutenberg content container
-            desc_container = detail_soup.select_one(".gutenberg")
-            if desc_container:
-                desc_text = desc_container.get_text(" ", strip=True)
+            ratelimit.wait(url)
+            job_detail = session.get(url, timeout=15)
+            desc_text = page_digest.reuse_or_parse(url, job_detail.text, parse_description)
         except:
             pass
 
@@ -46,11 +83,16 @@ def scrape_excelined():
             "description": desc_text   # NEW FIELD
         })
 
+    return jobs
+
+def scrape_excelined():
+    jobs = scrape()
+
     # Save JSON
-    with open("public/jobs_excelined.json", "w") as f:
+    with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
 
-    print("ExcelinEd jobs saved to public/jobs_excelined.json")
+    print(f"ExcelinEd jobs saved to {OUTPUT}")
 
 if __name__ == "__main__":
     scrape_excelined()
@@ -1,35 +1,30 @@
-import requests
 import json
+import os
+import sys
 
-API_URL = "https://careers-aei.icims.com/jobs/search?pr=0&schema=1&format=json"
-OUTPUT = "public/jobs_heritage.json"
-
-def scrape_heritage():
-    print("Requesting Heritage ICIMS JSON API...")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import ats_discovery
+from scraper import fetch_page, scrape_icims
 
-    response = requests.get(API_URL, headers={
-        "User-Agent": "Mozilla/5.0"
-    })
+CAREERS_URL = "https://www.heritage.org/careers"
+OUTPUT = "public/jobs_heritage.json"
 
-    if not response.ok:
-        print("❌ Failed to load API:", response.status_code)
-        return
+def scrape():
+    print("Resolving Heritage's iCIMS portal...")
 
-    data = response.json()
+    # the portal embedded in the careers page, remembered between runs
+    found = ats_discovery.resolve(CAREERS_URL, fetch_page)
+    if not found or found["platform"] != "iCIMS":
+        raise RuntimeError("❌ No iCIMS portal found on the Heritage careers page")
 
-    jobs = []
-    for item in data.get("jobs", []):
-        title = item.get("title", "N/A")
-        link = item.get("url", "N/A")
-        location = item.get("location", "Virtual")
+    return scrape_icims("Heritage Foundation", found["board"])
 
-        jobs.append({
-            "title": title,
-            "organization": "Heritage Foundation",
-            "location": location,
-            "type": "N/A",
-            "link": link
-        })
+def scrape_heritage():
+    try:
+        jobs = scrape()
+    except RuntimeError as e:
+        print(e)
+        return
 
     with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
@@ -38,4 +33,3 @@ def scrape_heritage():
 
 if __name__ == "__main__":
     scrape_heritage()
-
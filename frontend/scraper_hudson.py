@@ -1,61 +1,34 @@
-import requests
 import json
+import os
+import sys
 
-def scrape_hudson_jobs():
-    url = "https://recruiting.paylocity.com/recruiting/api/v2/companies/20837/jobs"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from scraper import fetch_paylocity, parse_paylocity
 
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) "
-                      "Chrome/115.0.0.0 Safari/537.36",
-        "Accept": "application/json",
-    }
+OUTPUT = "public/jobs_hudson.json"
 
+def scrape_hudson_jobs():
     print("Requesting Hudson job list from Paylocity API...")
 
-    response = requests.get(url, headers=headers)
-    response.raise_for_status()
-
-    try:
-        data = response.json()
-    except:
-        print("❌ API did not return JSON. Dumping response text:")
-        print(response.text[:1000])
+    # Shared session: rate-limited and answered from the on-disk cache on a 304
+    data = fetch_paylocity("20837")
+    if data is None:
+        print("❌ API did not return a JSON job list")
         return []
 
     print(f"Found {len(data)} jobs from API")
+    return parse_paylocity("Hudson Institute", "HUDSON-INSTITUTE-INC", data)
 
-    jobs = []
-    for job in data:
-        title = job.get("title", "N/A")
-        job_id = job.get("id")
-        location = job.get("city", "N/A")
-        state = job.get("state", "")
-
-        if state:
-            location = f"{location}, {state}"
 
-        # Construct job details page URL
-        link = f"https://recruiting.paylocity.com/recruiting/jobs/Details/{job_id}/HUDSON-INSTITUTE-INC"
-
-        jobs.append({
-            "title": title,
-            "organization": "Hudson Institute",
-            "location": location,
-            "type": "N/A",
-            "date_posted": job.get("createdDate", "N/A"),
-            "link": link
-        })
-
-    return jobs
+# plugin entry point (plugin_host.py)
+scrape = scrape_hudson_jobs
 
 
 if __name__ == "__main__":
     all_jobs = scrape_hudson_jobs()
 
-    output_path = "public/jobs_hudson.json"
+    output_path = OUTPUT
     with open(output_path, "w") as f:
         json.dump(all_jobs, f, indent=2)
 
     print(f"\nScraped {len(all_jobs)} Hudson jobs and saved to {output_path}")
-
@@ -1,29 +1,62 @@
 import requests
-from bs4 import BeautifulSoup
 import json
+import os
 import re
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import ats_discovery
+import html_parser
+import page_digest
+import ratelimit
+from scraper import fetch_page, scrape_jazzhr
 
 NTU_URL = "https://www.ntu.org/about/page/career-and-internship-opportunities"
 OUTPUT_FILE = "public/jobs_ntu.json"
 
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+SALARY_RE = re.compile(r"\s+[-–—]\s+salary.*$", re.I)
+
 def clean_title(title):
     """
-    Remove anything after the FIRST hyphen.
-    This guarantees salary ranges are removed.
+    Remove the salary range NTU appends to titles, keeping hyphenated titles whole.
     Example:
       'Vice President - Salary Range [$100,000]' -> 'Vice President'
     """
-    if "-" in title:
-        title = title.split("-")[0].strip()
-    return title.strip()
+    return SALARY_RE.sub("", title).strip()
+
+def scrape():
+    # JazzHR board linked from the careers page (cached): real locations,
+    # departments and dates in one request
+    found = ats_discovery.resolve(NTU_URL, fetch_page)
+    if found and found["platform"] == "JazzHR":
+        jobs = scrape_jazzhr("National Taxpayers Union", found["board"])
+        if jobs:
+            for job in jobs:
+                job["title"] = clean_title(job["title"])
+            return jobs
 
-def scrape_ntu():
     print("Requesting NTU job listings...")
 
-    response = requests.get(NTU_URL, headers={"User-Agent": "Mozilla/5.0"})
+    ratelimit.wait(NTU_URL)
+    response = session.get(NTU_URL, headers={"User-Agent": "Mozilla/5.0"})
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return page_digest.reuse_or_parse(NTU_URL, response.text, parse_ntu)
+
+def scrape_ntu():
+    jobs = scrape()
+
+    # Save results
+    with open(OUTPUT_FILE, "w") as f:
+        json.dump(jobs, f, indent=2)
+
+    print(f"\nSaved {len(jobs)} NTU jobs to {OUTPUT_FILE}")
+
+def parse_ntu(html):
+    soup = html_parser.parse(html)
 
     jobs = []
 
@@ -44,11 +77,7 @@ def scrape_ntu():
 
         print(f"Scraped job: {title}")
 
-    # Save results
-    with open(OUTPUT_FILE, "w") as f:
-        json.dump(jobs, f, indent=2)
-
-    print(f"\nSaved {len(jobs)} NTU jobs to {OUTPUT_FILE}")
+    return jobs
 
 if __name__ == "__main__":
     scrape_ntu()
@@ -1,12 +1,21 @@
 import requests
-from bs4 import BeautifulSoup
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import page_digest
+import ratelimit
+import wp_json
 
 PLF_URL = "https://pacificlegal.org/careers/"
 
 OUTPUT_FILE = "public/jobs_plf.json"
 
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
 
 def clean_location(text):
     """Normalize PLF location lines."""
@@ -20,16 +29,46 @@ def clean_location(text):
     return text.strip()
 
 
-def scrape_plf_jobs():
+def scrape():
+    # careers post type over wp-json when the site exposes one
+    posts = wp_json.jobs(session, PLF_URL)
+    if posts:
+        print(f"Found {len(posts)} PLF jobs via the REST API")
+        return [{
+            "title": post["title"] or "N/A",
+            "organization": "Pacific Legal Foundation",
+            "location": clean_location(post["location"]),
+            "type": "N/A",
+            "date_posted": post["date"],
+            "link": post["link"] or "N/A"
+        } for post in posts]
+
     print("Requesting PLF careers page...")
 
     headers = {
         "User-Agent": "Mozilla/5.0"
     }
-    response = requests.get(PLF_URL, headers=headers)
+    ratelimit.wait(PLF_URL)
+    response = session.get(PLF_URL, headers=headers)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    return page_digest.reuse_or_parse(PLF_URL, response.text, parse_plf_jobs)
+
+
+def scrape_plf_jobs():
+    results = scrape()
+
+    # SAVE JSON
+    full_path = os.path.join(os.getcwd(), OUTPUT_FILE)
+
+    with open(full_path, "w") as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\nSaved {len(results)} PLF jobs to {OUTPUT_FILE}")
+
+
+def parse_plf_jobs(html):
+    soup = html_parser.parse(html, only=[".career-item"], label="plf")
 
     job_cards = soup.select(".career-item")
     print(f"Found {len(job_cards)} PLF job cards\n")
@@ -56,17 +95,11 @@ def scrape_plf_jobs():
             "organization": "Pacific Legal Foundation",
             "location": location,
             "type": "N/A",
-            "date_posted": "N/A",
+            "date_posted": None,
             "link": link
         })
 
-    # SAVE JSON
-    full_path = os.path.join(os.getcwd(), OUTPUT_FILE)
-
-    with open(full_path, "w") as f:
-        json.dump(results, f, indent=2)
-
-    print(f"\nSaved {len(results)} PLF jobs to {OUTPUT_FILE}")
+    return results
 
 
 if __name__ == "__main__":
@@ -1,47 +1,105 @@
 import requests
 import json
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import link_cache
+import ratelimit
+import wp_json
+from tm_org_extract import org_from_html
+
+SITE = "https://talentmarket.org"
+LIST_URL = "https://talentmarket.org/job-openings/"
 OUTPUT = "public/jobs_talentmarket.json"
 
-API_URL = "https://talentmarket.org/wp-json/wp/v2/jobs/?per_page=100"
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
 
-def scrape_talent_market():
+# job URL -> organization; only postings we have not seen cost a detail fetch
+ORG_CACHE = link_cache.open_cache("tm_orgs", ttl=30 * link_cache.DAY, max_entries=5000)
+
+def scrape():
     print("Fetching Talent Market jobs from WordPress REST API...")
 
+    # every page of the "jobs" post type, 100 at a time, pages fetched concurrently
+    posts = wp_json.jobs(session, SITE, "jobs")
+    if posts is None:
+        print("REST API not available, falling back to the listing page")
+        return scrape_listing()
+
+    jobs = []
+
+    for post in posts:
+        # the posting body carries the "About the ..." paragraph, so no detail page is needed
+        org = post["organization"] or org_from_html(post["html"])
+
+        jobs.append({
+            "title": post["title"],
+            "organization": org or "Talent Market",
+            "location": post["location"] or "N/A",
+            "type": "N/A",
+            "date_posted": post["date"],
+            "url": post["link"]
+        })
+
+    return jobs
+
+
+def org_from_detail(url):
+    """Organization named on the posting's detail page (JSON-LD first), or "Talent Market"."""
+    org = ORG_CACHE.get(url)
+    if org:
+        return org
     try:
-        response = requests.get(API_URL, timeout=20)
+        ratelimit.wait(url)
+        response = session.get(url, timeout=20)
         response.raise_for_status()
-        posts = response.json()
-    except Exception as e:
-        print("Error fetching API:", e)
-        return
+        org = org_from_html(response.content)
+    except requests.RequestException:
+        return "Talent Market"
+    # the generic fallback is not worth remembering; retry it next run
+    if not org or org == "Talent Market":
+        return "Talent Market"
+    ORG_CACHE.put(url, org)
+    return org
+
+
+def scrape_listing():
+    ratelimit.wait(LIST_URL)
+    response = session.get(LIST_URL, timeout=20)
+    response.raise_for_status()
+    soup = html_parser.parse(response.text, only=[".content-preview-card"], label="talentmarket")
 
     jobs = []
 
-    for post in posts:
-        try:
-            title = post["title"]["rendered"].strip()
-            link = post["link"].strip()
-
-            # Extract fields
-            acf = post.get("acf", {})
-            location = acf.get("location", "N/A")
-            date_posted = post.get("date", "").split("T")[0]
-
-            job = {
-                "title": title,
-                "organization": "Talent Market",
-                "location": location,
-                "type": "N/A",
-                "url": link
-            }
-
-            jobs.append(job)
-
-        except Exception as e:
-            print("Error parsing job:", e)
+    for card in soup.select(".content-preview-card"):
+        title_el = card.select_one("h2 a")
+        if not title_el:
             continue
 
+        loc_el = card.select_one(".location")
+
+        jobs.append({
+            "title": title_el.get_text(strip=True),
+            # the card image's alt text is not reliably the employer
+            "organization": org_from_detail(title_el["href"]),
+            "location": loc_el.get_text(strip=True).replace("Location:", "").strip() if loc_el else "N/A",
+            "type": "N/A",
+            "url": title_el["href"]
+        })
+
+    return jobs
+
+
+def scrape_talent_market():
+    try:
+        jobs = scrape()
+    except Exception as e:
+        print("Error fetching API:", e)
+        return
+
     # Save output
     with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
@@ -51,4 +109,3 @@ def scrape_talent_market():
 
 if __name__ == "__main__":
     scrape_talent_market()
-
@@ -1,7 +1,13 @@
 import json
-import time
+import os
+import sys
 import requests
-from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import html_parser
+import jsonld
+import link_cache
+import ratelimit
 
 LIST_URL = "https://talentmarket.org/jobs/"
 OUTPUT = "public/jobs_talentmarket.json"
@@ -10,41 +16,62 @@ HEADERS = {
     "User-Agent": "Mozilla/5.0"
 }
 
+# job URL -> organization; only postings we have not seen cost a detail fetch
+ORG_CACHE = link_cache.open_cache("tm_orgs", ttl=30 * link_cache.DAY, max_entries=5000)
+
 
 def get_org_from_detail(url):
     """Visit job detail page and extract the organization name."""
+    org = ORG_CACHE.get(url)
+    if org:
+        return org
     try:
+        ratelimit.wait(url)
         res = requests.get(url, headers=HEADERS, timeout=10)
-        soup = BeautifulSoup(res.text, "html.parser")
+        org = parse_org(res.text)
+    except:
+        return "Talent Market"
+    # the generic fallback is not worth remembering; retry it next run
+    if org != "Talent Market":
+        ORG_CACHE.put(url, org)
+    return org
 
-        # The organization name ALWAYS appears in the first paragraph(s)
-        paragraphs = soup.select("p")
-        for p in paragraphs:
-            txt = p.get_text(" ", strip=True)
 
-            # Look for patterns
-            if txt.lower().startswith("about "):
-                # example: "About Legal Insurrection Foundation"
-                return txt.replace("About ", "").strip()
+def parse_org(html):
+    # schema.org JobPosting first: a byte scan, no DOM parse
+    posting = jsonld.extract(html)
+    if posting and posting["organization"] and posting["organization"] != "Talent Market":
+        return posting["organization"]
 
-            if " is a " in txt:
-                # example: "Do No Harm is a membership nonprofit..."
-                return txt.split(" is a ")[0].strip()
+    soup = html_parser.parse(html, label="tm detail")
 
-            if " is an " in txt:
-                # example: "Libertas Institute is an innovative..."
-                return txt.split(" is an ")[0].strip()
+    # The organization name ALWAYS appears in the first paragraph(s)
+    paragraphs = soup.select("p")
+    for p in paragraphs:
+        txt = p.get_text(" ", strip=True)
 
-        return "Talent Market"
-    except:
-        return "Talent Market"
+        # Look for patterns
+        if txt.lower().startswith("about "):
+            # example: "About Legal Insurrection Foundation"
+            return txt.replace("About ", "").strip()
+
+        if " is a " in txt:
+            # example: "Do No Harm is a membership nonprofit..."
+            return txt.split(" is a ")[0].strip()
+
+        if " is an " in txt:
+            # example: "Libertas Institute is an innovative..."
+            return txt.split(" is an ")[0].strip()
+
+    return "Talent Market"
 
 
 def scrape_talent_market():
     print("Fetching Talent Market job list...")
 
+    ratelimit.wait(LIST_URL)
     res = requests.get(LIST_URL, headers=HEADERS, timeout=10)
-    soup = BeautifulSoup(res.text, "html.parser")
+    soup = html_parser.parse(res.text, only=[".content-preview-card"], label="tm")
 
     cards = soup.select(".content-preview-card")
     print(f"Found {len(cards)} job cards")
@@ -77,7 +104,6 @@ def scrape_talent_market():
             }
 
             jobs.append(job)
-            time.sleep(0.3)
 
         except Exception as e:
             print("Error parsing job:", e)
@@ -87,6 +113,8 @@ def scrape_talent_market():
     with open(OUTPUT, "w") as f:
         json.dump(jobs, f, indent=2)
 
+    c = ORG_CACHE.report()
+    print(f"Organizations: {c['hits']} from cache, {c['misses']} detail pages fetched")
     print(f"Saved {len(jobs)} Talent Market jobs to {OUTPUT}")
 
 
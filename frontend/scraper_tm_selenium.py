@@ -1,47 +1,59 @@
+import itertools
 import json
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+import os
+import sys
 from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
 
-OUTPUT = "public/jobs_talentmarket.json"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import browser_pool
+import page_ready
+import paginate
 
+CARD = ".content-preview-card"
+LISTING = "https://talentmarket.org/job-openings/"
+MAX_PAGES = 200
 
-# -------------------------
-# SET UP SELENIUM BROWSER
-# -------------------------
-def start_browser():
-    chrome_options = Options()
-    chrome_options.add_argument("--disable-gpu")
-    chrome_options.add_argument("--no-sandbox")
-    chrome_options.add_argument("--disable-dev-shm-usage")
-    chrome_options.add_experimental_option("detach", True)  # Keep window open
-
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=chrome_options)
-    driver.set_page_load_timeout(30)
-    return driver
+OUTPUT = "public/jobs_talentmarket.json"
 
 
 # -----------------------------------------
-# GET ALL LISTING PAGES (page/1 to page/99)
+# FIND THE LAST LISTING PAGE (read once, not walked)
 # -----------------------------------------
-def get_listing_pages(driver):
-    pages = []
-    for i in range(1, 50):  # 50 is safe upper bound
-        url = f"https://talentmarket.org/job-openings/page/{i}/"
-        driver.get(url)
-        time.sleep(2)
+def listing_url(page):
+    return f"{LISTING}page/{page}/"
+
+
+def read_first_page(driver):
+    """(last page number, cards on page 1): the count comes from page 1's
+    pagination links, or from probing when it has none."""
+    page_ready.goto(driver, listing_url(1), selector=CARD, timeout=5)
+    cards = extract_jobs_from_listing_page(driver)
+    if not cards:
+        return 0, []
+
+    links = driver.find_elements(By.CSS_SELECTOR, "a[href*='/job-openings/page/']")
+    last = paginate.last_page_from_links(a.get_attribute("href") for a in links)
+    if last:
+        return last, cards
+
+    # no pagination block: galloping/binary search over page existence
+    def exists(page):
+        # past the last page the cards never show up, so keep that wait short
+        page_ready.goto(driver, listing_url(page), selector=CARD, timeout=5)
+        return bool(driver.find_elements(By.CSS_SELECTOR, CARD))
 
-        cards = driver.find_elements(By.CSS_SELECTOR, ".content-preview-card")
-        if len(cards) == 0:
-            break
+    return paginate.probe_last_page(exists, first=2, limit=MAX_PAGES), cards
 
-        pages.append(url)
 
-    return pages
+def fetch_listing_page(page):
+    """Cards on one listing page, in its own pooled tab (runs on a worker thread)."""
+    try:
+        with browser_pool.lease() as driver:
+            page_ready.goto(driver, listing_url(page), selector=CARD)
+            return extract_jobs_from_listing_page(driver)
+    except Exception as e:
+        print(f"Error on listing page {page}: {e}")
+        return []
 
 
 # ---------------------------------------------------
@@ -72,8 +84,7 @@ def extract_jobs_from_listing_page(driver):
 # VISIT EACH JOB DETAIL PAGE TO GET TRUE ORG + LOC
 # ---------------------------------------------------
 def scrape_detail_page(driver, job_url):
-    driver.get(job_url)
-    time.sleep(2)
+    page_ready.goto(driver, job_url, selector="p.article-about")
 
     try:
         about = driver.find_element(By.CSS_SELECTOR, "p.article-about").text.strip().split("\n")
@@ -89,51 +100,60 @@ def scrape_detail_page(driver, job_url):
 # -------------------------
 # MAIN SCRAPER
 # -------------------------
-def scrape_talent_market():
-    driver = start_browser()
+def scrape():
     print("\n=== TALENT MARKET SCRAPER STARTED ===\n")
 
-    print("Discovering listing pages...")
-    listing_pages = get_listing_pages(driver)
-    print(f"Found {len(listing_pages)} pages\n")
+    # page 1 is read once: its cards are kept and its pagination gives the page count
+    with browser_pool.lease() as driver:
+        last, first_cards = read_first_page(driver)
+    print(f"Found {last} pages\n")
+
+    # listing pages 2..N load concurrently; each page's cards go straight to
+    # the detail stage as soon as that page is done. One pooled browser is
+    # left to the detail stage, so details stream instead of waiting for the
+    # listing workers to finish.
+    workers = max(1, browser_pool.get_pool().size - 1)
+    listings = [(1, first_cards)]
+    listings = itertools.chain(listings, paginate.stream(fetch_listing_page, range(2, last + 1),
+                                                         workers=workers))
 
-    # Collect listing-level jobs (title + link)
-    found_jobs = []
     seen_urls = set()
+    final_jobs = []
+    for page, cards in listings:
+        new = [(i, j) for i, j in enumerate(cards) if j["url"] not in seen_urls]
+        seen_urls.update(j["url"] for _, j in new)
+        if not new:
+            continue
+        print(f"Listing page {page}: {len(new)} jobs")
+        with browser_pool.lease() as driver:
+            for i, j in new:
+                job = scrape_job(driver, j)
+                if job:
+                    final_jobs.append(((page, i), job))
 
-    for page_url in listing_pages:
-        print(f"Scraping listing page: {page_url}")
-        driver.get(page_url)
-        time.sleep(2)
+    # same order as the listing pages, whatever order they finished in
+    final_jobs.sort(key=lambda pair: pair[0])
+    return [job for _, job in final_jobs]
 
-        listing_jobs = extract_jobs_from_listing_page(driver)
-        for j in listing_jobs:
-            if j["url"] not in seen_urls:
-                found_jobs.append(j)
-                seen_urls.add(j["url"])
 
-    print(f"\nCollected {len(found_jobs)} jobs from listings")
-    print("Now scraping each job's detail page...\n")
+def scrape_job(driver, j):
+    try:
+        org, location = scrape_detail_page(driver, j["url"])
+    except Exception as e:
+        print(f"Error on {j['url']}: {e}")
+        return None
+    print(f"✓ {j['title']} — {org}")
+    return {
+        "title": j["title"],
+        "organization": org,
+        "location": location,
+        "url": j["url"],
+        "type": "N/A"
+    }
 
-    final_jobs = []
 
-    for j in found_jobs:
-        try:
-            org, location = scrape_detail_page(driver, j["url"])
-            job = {
-                "title": j["title"],
-                "organization": org,
-                "location": location,
-                "url": j["url"],
-                "type": "N/A"
-            }
-            final_jobs.append(job)
-            print(f"✓ {j['title']} — {org}")
-
-        except Exception as e:
-            print(f"Error on {j['url']}: {e}")
-
-    driver.quit()
+def scrape_talent_market():
+    final_jobs = scrape()
 
     # Write output
     with open(OUTPUT, "w") as f:
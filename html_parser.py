@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+One HTML parsing entry point for every scraper, on the fastest backend available.
+
+- parse(html) returns a BeautifulSoup document, so the select / select_one /
+  find / find_all / get_text calls the scrapers use work unchanged
+- Backend: lxml when installed (several times faster than the pure-Python
+  "html.parser"), else html.parser; CJB_HTML_PARSER=<name> forces one
+- parse(html, only=[...]) builds just the subtrees under the given container
+  selectors (SoupStrainer-style), skipping menus, footers and scripts; the
+  full selectors still work on the result
+- Every parse records time, input size and, while tracemalloc is tracing,
+  peak memory per label (report(); plugin_host.py --trace-memory)
+- bench(paths) times every available backend over saved pages, and the
+  chosen backend with the page's `only` containers, checking that the
+  partial parse finds the same elements; `python html_parser.py` runs it
+  over the committed per-site pages in fixtures/html/ (--cached adds the
+  HTTP cache's bodies and the pages saved in frontend/public/)
+
+Usage:
+    import html_parser
+    soup = html_parser.parse(r.text, only=[".career-item"], label="plf")
+"""
+
+import argparse
+import glob
+import os
+import re
+import statistics
+import sys
+import threading
+import time
+import tracemalloc
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Sequence
+
+from bs4 import BeautifulSoup, FeatureNotFound, SoupStrainer
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PREFERENCE = ("lxml", "html.parser")
+# one page per scraper that parses with only=[...]; each names its containers in
+# a leading <!-- html_parser bench: only=<selectors> --> comment
+FIXTURE_GLOBS = (os.path.join(ROOT, "fixtures", "html", "*.html"),)
+CACHED_GLOBS = (
+    os.path.join(ROOT, "frontend", "public", "*.html"),
+    os.path.join(ROOT, ".cache", "http", "*.body"),
+)
+BENCH_ONLY_RE = re.compile(r"<!--\s*html_parser bench:\s*only=(.+?)\s*-->")
+
+
+def available_backends() -> List[str]:
+    found = []
+    for name in PREFERENCE:
+        try:
+            BeautifulSoup("<p></p>", name)
+        except FeatureNotFound:
+            continue
+        found.append(name)
+    return found
+
+
+def pick_backend() -> str:
+    forced = os.environ.get("CJB_HTML_PARSER")
+    backends = available_backends()
+    if forced and forced in backends:
+        return forced
+    return backends[0]
+
+
+BACKEND = pick_backend()
+
+
+# ---------------- Partial parsing ----------------
+# First compound of a selector: tag, .class, #id, [attr], [attr op "value"]
+COMPOUND_RE = re.compile(r"""^\s*([\w*-]*)((?:[.#][\w-]+|\[[^\]]+\])*)""")
+PART_RE = re.compile(r"""([.#])([\w-]+)|\[\s*([\w:-]+)\s*(?:([*^$~|]?=)\s*["']?([^"'\]]*)["']?)?\s*\]""")
+
+ATTR_OPS: Dict[str, Callable[[str, str], bool]] = {
+    "=": lambda v, x: v == x,
+    "*=": lambda v, x: x in v,
+    "^=": lambda v, x: v.startswith(x),
+    "$=": lambda v, x: v.endswith(x),
+    "~=": lambda v, x: x in v.split(),
+    "|=": lambda v, x: v == x or v.startswith(x + "-"),
+}
+
+
+def _attr(attrs, name: str) -> Optional[str]:
+    v = attrs.get(name)
+    return " ".join(v) if isinstance(v, (list, tuple)) else v
+
+
+def _compile_compound(selector: str) -> Optional[Callable]:
+    m = COMPOUND_RE.match(selector)
+    if not m or not (m.group(1) or m.group(2)):
+        return None
+    rest = selector[m.end():]
+    if rest and not rest[0].isspace() and rest[0] not in ">+~":
+        return None   # pseudo-classes etc.: not worth guessing, parse everything
+    tag = m.group(1) if m.group(1) not in ("", "*") else None
+    tests = []
+    for dot, word, attr, op, value in PART_RE.findall(m.group(2)):
+        if dot == ".":
+            tests.append(lambda a, w=word: w in (_attr(a, "class") or "").split())
+        elif dot == "#":
+            tests.append(lambda a, w=word: _attr(a, "id") == w)
+        elif op:
+            tests.append(lambda a, n=attr, f=ATTR_OPS[op], x=value: _attr(a, n) is not None and f(_attr(a, n), x))
+        else:
+            tests.append(lambda a, n=attr: _attr(a, n) is not None)
+    return lambda name, attrs: (tag is None or name == tag) and all(t(attrs) for t in tests)
+
+
+class ContainerStrainer(SoupStrainer):
+    """Keeps only tags matching one of `selectors`' outermost compounds (with their subtrees)."""
+
+    def __init__(self, matchers: Sequence[Callable]):
+        super().__init__()
+        self.matchers = matchers
+
+    @property
+    def includes_everything(self) -> bool:
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs) -> bool:   # bs4 >= 4.13
+        attrs = attrs or {}
+        return any(m(name, attrs) for m in self.matchers)
+
+    def search_tag(self, name, attrs=None):                       # older bs4
+        return self.allow_tag_creation(None, name, dict(attrs or {}))
+
+
+@lru_cache(maxsize=128)
+def strainer(selectors: Sequence[str]) -> Optional[ContainerStrainer]:
+    """ContainerStrainer for CSS `selectors`, or None if one can't be compiled."""
+    matchers = []
+    for group in selectors:
+        for sel in group.split(","):
+            m = _compile_compound(sel)
+            if m is None:
+                return None
+            matchers.append(m)
+    return ContainerStrainer(matchers) if matchers else None
+
+
+# ---------------- Parsing ----------------
+stats: Dict[str, Dict[str, float]] = {}
+_lock = threading.Lock()
+
+
+def _record(label: str, seconds: float, size: int, peak: Optional[int]):
+    with _lock:
+        s = stats.setdefault(label, {"pages": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0, "peak_kb": None})
+        s["pages"] += 1
+        s["seconds"] += seconds
+        s["max_seconds"] = max(s["max_seconds"], seconds)
+        s["bytes"] += size
+        if peak is not None:
+            s["peak_kb"] = max(s["peak_kb"] or 0, peak // 1024)
+
+
+def parse(markup, backend: Optional[str] = None, only: Optional[Sequence[str]] = None,
+          label: str = "other") -> BeautifulSoup:
+    """
+    BeautifulSoup document for `markup` (str or bytes) on the chosen backend.
+    With `only`, just the subtrees under those container selectors are built.
+    """
+    parse_only = strainer(tuple(only)) if only else None
+    tracing = tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    soup = BeautifulSoup(markup or "", backend or BACKEND, parse_only=parse_only)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1] - base if tracing else None
+    _record(label, elapsed, len(markup or ""), peak)
+    return soup
+
+
+def report() -> Dict[str, Dict[str, float]]:
+    with _lock:
+        return {label: {**s, "seconds": round(s["seconds"], 4), "max_seconds": round(s["max_seconds"], 4)}
+                for label, s in stats.items()}
+
+
+# ---------------- Benchmark ----------------
+def fixtures(patterns=FIXTURE_GLOBS) -> List[str]:
+    paths = []
+    for pattern in patterns:
+        for path in sorted(glob.glob(pattern)):
+            try:
+                with open(path, "rb") as f:
+                    head = f.read(2048).lower()
+            except OSError:
+                continue
+            if b"<html" in head or b"<!doctype html" in head:
+                paths.append(path)
+    return paths
+
+
+def _median(fn: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return statistics.median(times)
+
+
+def bench(paths: List[str], repeat: int = 5) -> Dict[str, Dict[str, float]]:
+    """
+    {path: {backend: median seconds}} for every available backend (full
+    parse), plus "only" (the chosen backend with the page's containers) and
+    "only_ok" (the partial parse selects as many elements as the full one)
+    for pages that declare them.
+    """
+    backends = available_backends()
+    results = {}
+    for path in paths:
+        with open(path, "rb") as f:
+            markup = f.read().decode("utf-8", "replace")
+        row = {name: _median(lambda: BeautifulSoup(markup, name).select("a"), repeat) for name in backends}
+        m = BENCH_ONLY_RE.search(markup[:2048])
+        if m:
+            only = (m.group(1),)
+            row["only"] = _median(lambda: BeautifulSoup(markup, BACKEND, parse_only=strainer(only)), repeat)
+            full = BeautifulSoup(markup, BACKEND).select(only[0])
+            part = BeautifulSoup(markup, BACKEND, parse_only=strainer(only)).select(only[0])
+            row["only_ok"] = bool(full) and len(part) == len(full)
+        results[path] = row
+    return results
+
+
+def fastest(row: Dict[str, float]) -> float:
+    """What the scrapers pay for this page: the partial parse if it has one, else the chosen backend."""
+    return row.get("only", row[BACKEND])
+
+
+def print_bench(results: Dict[str, Dict[str, float]]):
+    backends = available_backends()
+    print(f"{'fixture':<40} " + " ".join(f"{b:>12}" for b in backends) + f" {BACKEND + '+only':>14}")
+    totals = {b: 0.0 for b in backends}
+    for path, row in results.items():
+        name = os.path.basename(path)[:40]
+        only = (f"{row['only'] * 1000:>12.1f}ms" + ("" if row["only_ok"] else " ❌ misses elements")
+                if "only" in row else f"{'-':>14}")
+        print(f"{name:<40} " + " ".join(f"{row[b] * 1000:>10.1f}ms" for b in backends) + " " + only)
+        for b in backends:
+            totals[b] += row[b]
+    used = sum(fastest(row) for row in results.values())
+    print(f"{'total':<40} " + " ".join(f"{totals[b] * 1000:>10.1f}ms" for b in backends) + f" {used * 1000:>12.1f}ms")
+    if "html.parser" in totals and used:
+        print(f"\n⚡ {BACKEND} with only=[...] is {totals['html.parser'] / used:.1f}x faster than a full html.parser parse")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Benchmark HTML parser backends over saved pages")
+    p.add_argument("paths", nargs="*", help="HTML files (default: fixtures/html/*.html)")
+    p.add_argument("--cached", action="store_true",
+                   help="also bench frontend/public/*.html and the HTTP cache's bodies")
+    p.add_argument("--repeat", type=int, default=5)
+    p.add_argument("--min-speedup", type=float, default=0.0,
+                   help="exit 1 unless what the scrapers use beats a full html.parser parse by this factor")
+    args = p.parse_args(argv)
+
+    paths = args.paths or fixtures(FIXTURE_GLOBS + (CACHED_GLOBS if args.cached else ()))
+    if not paths:
+        print("No HTML fixtures found")
+        return 1
+    results = bench(paths, args.repeat)
+    print_bench(results)
+
+    if any(row.get("only_ok") is False for row in results.values()):
+        print("❌ a partial parse missed elements the full parse found")
+        return 1
+    if args.min_speedup:
+        fast = sum(fastest(r) for r in results.values())
+        slow = sum(r["html.parser"] for r in results.values())
+        if fast and slow / fast < args.min_speedup:
+            print(f"❌ speedup below {args.min_speedup}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
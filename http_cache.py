@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+On-disk conditional-request cache used by scraper.safe_get/safe_post.
+
+- Stores the body and validators (ETag / Last-Modified) of every response
+  that has them, under .cache/http/
+- Next run sends If-None-Match / If-Modified-Since; a 304 is turned back into
+  a normal 200 Response from disk (resp.from_cache = True), with the
+  Content-Type and paging headers (KEPT_HEADERS) of the original answer
+- Size-bounded: least-recently-used entries are evicted above MAX_BYTES
+- Index is written at interpreter exit; report() gives hit/miss/bytes saved
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "http")
+MAX_BYTES = 200 * 1024 * 1024
+KEPT_HEADERS = ("Content-Type", "Link", "X-WP-Total", "X-WP-TotalPages")
+
+
+class HttpCache:
+    def __init__(self, root: str = CACHE_DIR, max_bytes: int = MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root, "index.json")
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "stored": 0, "evicted": 0, "bytes_saved": 0}
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        try:
+            with open(self.index_path, encoding="utf-8") as f:
+                self.entries = json.load(f)
+        except Exception:
+            self.entries = {}
+
+    # ---------------- keys & validators ----------------
+    @staticmethod
+    def key(method: str, url: str, body: Any = None) -> str:
+        h = hashlib.sha1(f"{method.upper()} {url}".encode("utf-8"))
+        if body is not None:
+            h.update(json.dumps(body, sort_keys=True, default=str).encode("utf-8"))
+        return h.hexdigest()
+
+    def body_path(self, key: str) -> str:
+        return os.path.join(self.root, key + ".body")
+
+    def validators(self, key: str) -> Dict[str, str]:
+        with self.lock:
+            e = self.entries.get(key)
+        if not e or not os.path.exists(self.body_path(key)):
+            return {}
+        headers = {}
+        if e.get("etag"):
+            headers["If-None-Match"] = e["etag"]
+        if e.get("last_modified"):
+            headers["If-Modified-Since"] = e["last_modified"]
+        return headers
+
+    # ---------------- store / replay ----------------
+    def store(self, key: str, resp: requests.Response):
+        with self.lock:
+            self.stats["misses"] += 1
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if not (etag or last_modified) or "no-store" in resp.headers.get("Cache-Control", "").lower():
+            return
+        body = resp.content
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            with open(self.body_path(key), "wb") as f:
+                f.write(body)
+        except OSError:
+            return
+        with self.lock:
+            self.entries[key] = {
+                "url": resp.url,
+                "etag": etag,
+                "last_modified": last_modified,
+                "content_type": resp.headers.get("Content-Type"),
+                "headers": {h: resp.headers[h] for h in KEPT_HEADERS if h in resp.headers},
+                "encoding": resp.encoding,
+                "size": len(body),
+                "last_used": time.time(),
+            }
+            self.stats["stored"] += 1
+
+    def replay(self, key: str, not_modified: requests.Response) -> Optional[requests.Response]:
+        """Rebuild a 200 Response from disk for a 304 answer."""
+        with self.lock:
+            e = self.entries.get(key)
+        if not e:
+            return None
+        try:
+            with open(self.body_path(key), "rb") as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        r = requests.Response()
+        r.status_code = 200
+        r._content = body
+        r.url = e.get("url") or not_modified.url
+        r.encoding = e.get("encoding")
+        r.headers = CaseInsensitiveDict(e.get("headers") or {"Content-Type": e.get("content_type") or ""})
+        r.request = not_modified.request
+        r.from_cache = True
+        r.cache_key = key
+        with self.lock:
+            e["last_used"] = time.time()
+            self.stats["hits"] += 1
+            self.stats["bytes_saved"] += len(body)
+        return r
+
+    # ---------------- housekeeping ----------------
+    def evict(self):
+        with self.lock:
+            total = sum(e.get("size", 0) for e in self.entries.values())
+            for key, e in sorted(self.entries.items(), key=lambda kv: kv[1].get("last_used", 0)):
+                if total <= self.max_bytes:
+                    break
+                total -= e.get("size", 0)
+                del self.entries[key]
+                self.stats["evicted"] += 1
+                try:
+                    os.remove(self.body_path(key))
+                except OSError:
+                    pass
+
+    def save(self):
+        if not self.entries:
+            return
+        self.evict()
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            tmp = self.index_path + ".tmp"
+            with self.lock, open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.index_path)
+        except OSError:
+            pass
+
+    def report(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats)
+
+
+cache = HttpCache()
+atexit.register(cache.save)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+One job-category classifier for every source.
+
+- CATEGORIES is the single keyword table (first category wins), replacing
+  the per-scraper classify_type() copies and the YAF if/elif chain
+- All keywords are compiled into one case-insensitive regex, matched as whole
+  words, so a title or a whole job description is classified in a single scan
+- classify(title, description, ...) tries each text in order: the title
+  decides when it has a keyword, the body only breaks ties for vague titles
+- classify_jobs(jobs) fills `type` across a merged job list (memoized per text)
+
+Usage:
+    from job_types import classify
+    job["type"] = classify(title)
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence
+
+# (category, keywords) in priority order. Keywords are regexes matched as whole
+# words, so the inflections that count are spelled out ("events?", not "event",
+# which would also hit "eventually")
+CATEGORIES = [
+    ("Policy", ["policy", "analysts?", r"research(?:ers?)?", "economists?", r"fellow(?:s|ships?)?",
+                "legislative", "analysis"]),
+    ("Communications", ["communications?", "social media", r"editor(?:s|ial)?", "writers?",
+                        r"podcast(?:s|ing)?", "public relations", "marketing", r"journalis(?:m|ts?)"]),
+    ("Legal", ["legal", "attorneys?", "counsel", "litigation", "paralegals?"]),
+    ("Government Affairs", ["government affairs", "government relations", r"lobby(?:ing|ists?)?"]),
+    ("Media", ["media", "press"]),
+    ("Development", ["development", r"fundrais(?:ing|ers?)", "donors?", r"philanthrop(?:y|ic)"]),
+    ("Education", ["education(?:al)?", "students?", "teachers?", "schools?", "campus(?:es)?"]),
+    ("Programs", ["events?", "conferences?", r"program(?:s|ming|mes?)?", "outreach", "field",
+                  "organi[sz]ers?"]),
+    ("Operations", ["operations", "managers?", "coordinators?", "assistants?", "finance",
+                    r"account(?:ing|ants?)", r"administrat(?:ion|ive|ors?)"]),
+    ("Creative / Digital", ["graphics?", r"design(?:ers?)?", "creative", "digital", "videos?"]),
+]
+
+DEFAULT = "Other"
+UNSET = {"", "N/A", None}
+
+# one named group per category (c0 = highest priority), each keyword bounded
+# on both sides; longest first within a category
+PATTERN = re.compile(r"\b(?:" + "|".join(
+    f"(?P<c{i}>" + "|".join(sorted(words, key=len, reverse=True)) + ")" for i, (_, words) in enumerate(CATEGORIES)
+) + r")\b", re.IGNORECASE)
+
+
+@lru_cache(maxsize=4096)
+def _rank(text: str) -> Optional[int]:
+    best = None
+    for m in PATTERN.finditer(text):
+        r = int(m.lastgroup[1:])
+        if best is None or r < best:
+            best = r
+            if best == 0:
+                break
+    return best
+
+
+def classify(*texts: Optional[str], default: str = DEFAULT) -> str:
+    """Category of the first text (title, then description, ...) that has a keyword."""
+    for text in texts:
+        if text:
+            r = _rank(text)
+            if r is not None:
+                return CATEGORIES[r][0]
+    return default
+
+
+def classify_jobs(jobs: Iterable[Dict], fields: Sequence[str] = ("title", "description"),
+                  overwrite: bool = False, default: str = DEFAULT) -> List[Dict]:
+    """Set `type` on every job that has none (or on all of them with overwrite=True)."""
+    jobs = list(jobs)
+    for job in jobs:
+        if overwrite or job.get("type") in UNSET:
+            job["type"] = classify(*(job.get(f) for f in fields), default=default)
+    return jobs
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+schema.org JobPosting (JSON-LD) extraction, before any DOM parse.
+
+- Many careers sites and ATS detail pages embed
+  <script type="application/ld+json"> {"@type": "JobPosting", ...} </script>;
+  the script bodies are cut out of the raw bytes with one regex (and only
+  when b"JobPosting" occurs at all), then json.loads'd -- no BeautifulSoup
+- postings(body): every JobPosting, including ones nested in @graph or lists
+- extract(body): the first posting flattened to title / organization /
+  location / employment_type / date_posted (YYYY-MM-DD) / link / description,
+  or None, so callers fall back to their page heuristics
+- place(value): readable location from text, a Place / PostalAddress, or a list
+
+Usage:
+    import jsonld
+    posting = jsonld.extract(resp.content)
+    org = posting["organization"] if posting else parse_org(resp.text)
+"""
+
+import html
+import json
+import re
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+import dates
+
+SCRIPT_RE = re.compile(rb"""<script[^>]*?type\s*=\s*["']?application/ld\+json["']?[^>]*>(.*?)</script\s*>""",
+                       re.I | re.S)
+WRAPPER_RE = re.compile(r"^\s*(?:<!--|<!\[CDATA\[)|(?:-->|\]\]>)\s*$")
+TAG_RE = re.compile(r"<[^>]+>")
+
+REMOTE_TYPES = {"TELECOMMUTE", "REMOTE"}
+
+stats = {"found": 0, "missing": 0}
+_lock = threading.Lock()
+
+
+def _bytes(body: Union[str, bytes]) -> bytes:
+    return body.encode("utf-8", "ignore") if isinstance(body, str) else (body or b"")
+
+
+def blocks(body: Union[str, bytes]) -> List[Any]:
+    """Decoded JSON of every ld+json script in `body`; unreadable blocks are skipped."""
+    out = []
+    for raw in SCRIPT_RE.findall(_bytes(body)):
+        text = WRAPPER_RE.sub("", raw.decode("utf-8", "replace"))
+        try:
+            out.append(json.loads(text, strict=False))   # strict=False: raw newlines inside strings
+        except ValueError:
+            continue
+    return out
+
+
+def _is_posting(node: Dict) -> bool:
+    t = node.get("@type")
+    return t == "JobPosting" or (isinstance(t, list) and "JobPosting" in t)
+
+
+def _walk(node) -> Iterator[Dict]:
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk(item)
+    elif isinstance(node, dict):
+        if _is_posting(node):
+            yield node
+        for key in ("@graph", "mainEntity", "itemListElement", "item"):
+            if key in node:
+                yield from _walk(node[key])
+
+
+def postings(body: Union[str, bytes]) -> List[Dict]:
+    """Every JobPosting object in `body`'s JSON-LD."""
+    raw = _bytes(body)
+    if b"JobPosting" not in raw:
+        return []
+    return [p for block in blocks(raw) for p in _walk(block)]
+
+
+def text(value) -> str:
+    """Plain text from an HTML-bearing field (descriptions are often escaped HTML)."""
+    if not isinstance(value, str):
+        return ""
+    return " ".join(html.unescape(TAG_RE.sub(" ", html.unescape(value))).split())
+
+
+def _name(value) -> str:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("name")
+    return text(value) if isinstance(value, str) else ""
+
+
+def place(value) -> str:
+    """A location given as text, a schema.org Place / PostalAddress, or a list of them."""
+    if isinstance(value, list):
+        return "; ".join(p for p in dict.fromkeys(place(v) for v in value) if p)
+    if isinstance(value, dict):
+        addr = value.get("address") if isinstance(value.get("address"), dict) else value
+        parts = [addr.get(k) for k in ("addressLocality", "city", "addressRegion", "state")]
+        found = ", ".join(str(p).strip() for p in parts if p and isinstance(p, str))
+        return found or _name(value) or _name(addr.get("addressCountry"))
+    return text(value) if isinstance(value, str) else ""
+
+
+def _employment_type(value) -> str:
+    values = value if isinstance(value, list) else [value]
+    return ", ".join(v.replace("_", " ").title() for v in values if isinstance(v, str) and v)
+
+
+def summarize(posting: Dict) -> Dict[str, Optional[str]]:
+    location = place(posting.get("jobLocation"))
+    remote = str(posting.get("jobLocationType") or "").upper() in REMOTE_TYPES
+    if remote:
+        where = place(posting.get("applicantLocationRequirements"))
+        location = "; ".join(p for p in (location, f"Remote ({where})" if where else "Remote") if p)
+    return {
+        "title": text(posting.get("title")) or None,
+        "organization": _name(posting.get("hiringOrganization")) or None,
+        "location": location or None,
+        "employment_type": _employment_type(posting.get("employmentType")) or None,
+        "date_posted": dates.normalize(posting.get("datePosted")),
+        "link": posting.get("url") if isinstance(posting.get("url"), str) else None,
+        "description": text(posting.get("description")),
+    }
+
+
+def extract(body: Union[str, bytes]) -> Optional[Dict[str, Optional[str]]]:
+    """First JobPosting in `body`, flattened (see summarize()), or None."""
+    found = postings(body)
+    with _lock:
+        stats["found" if found else "missing"] += 1
+    return summarize(found[0]) if found else None
+
+
+def report() -> Dict[str, int]:
+    with _lock:
+        return dict(stats)
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Small persistent key -> value cache with a TTL and a max size.
+
+Used to remember facts that cost a detail-page fetch to learn, e.g. the
+organization behind a Talent Market job URL, so only new postings trigger
+a request on the next run.
+
+- Stored as .cache/<name>.json, written at interpreter exit
+- Entries older than `ttl` seconds are treated as missing
+- Above `max_entries`, the oldest entries are dropped on save
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache")
+DAY = 24 * 60 * 60
+
+
+class TTLCache:
+    def __init__(self, name: str, ttl: float = 30 * DAY, max_entries: int = 5000, root: str = CACHE_DIR):
+        self.path = os.path.join(root, f"{name}.json")
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0}
+        self.dirty = False
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                self.entries: Dict[str, Dict[str, Any]] = json.load(f)
+        except Exception:
+            self.entries = {}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self.lock:
+            e = self.entries.get(key)
+            if e and time.time() - e.get("at", 0) <= self.ttl:
+                self.stats["hits"] += 1
+                return e["value"]
+            self.stats["misses"] += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        with self.lock:
+            self.entries[key] = {"value": value, "at": time.time()}
+            self.dirty = True
+
+    def prune(self):
+        now = time.time()
+        with self.lock:
+            live = {k: e for k, e in self.entries.items() if now - e.get("at", 0) <= self.ttl}
+            if len(live) > self.max_entries:
+                newest = sorted(live.items(), key=lambda kv: kv[1]["at"], reverse=True)[:self.max_entries]
+                live = dict(newest)
+            if len(live) != len(self.entries):
+                self.entries = live
+                self.dirty = True
+
+    def save(self):
+        self.prune()
+        if not self.dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp = self.path + ".tmp"
+            with self.lock, open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entries, f)
+            os.replace(tmp, self.path)
+            self.dirty = False
+        except OSError:
+            pass
+
+    def report(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats, size=len(self.entries))
+
+
+def open_cache(name: str, ttl: float = 30 * DAY, max_entries: int = 5000) -> TTLCache:
+    c = TTLCache(name, ttl=ttl, max_entries=max_entries)
+    atexit.register(c.save)
+    return c
@@ -1,14 +1,7 @@
 import json
 
-tm = json.load(open("frontend/public/jobs_talentmarket.json"))
-yaf = json.load(open("frontend/public/jobs_yaf.json"))
-
-titles = {j["title"] for j in tm}
-final = tm + [j for j in yaf if j["title"] not in titles]
-
-json.dump(final, open("frontend/public/jobs.json","w"), indent=2)
-print("done", len(final))
-import json
+from dates import normalize_jobs
+from job_types import classify_jobs
 
 TM = "frontend/public/jobs_talentmarket.json"
 YAF = "frontend/public/jobs_yaf.json"
@@ -21,22 +14,33 @@ def read_file(path):
     except:
         return []
 
-tm = read_file(TM)
-yaf = read_file(YAF)
+def merge(tm_path=TM, yaf_path=YAF, out=OUT):
+    tm = read_file(tm_path)
+    yaf = read_file(yaf_path)
+
+    combined = tm + yaf
 
-combined = tm + yaf
+    # DE-DUPE BY LINK
+    seen = set()
+    unique = []
+    for job in combined:
+        # Talent Market rows carry "url", the rest "link"
+        key = job.get("link") or job.get("url")
+        if key not in seen:
+            unique.append(job)
+            seen.add(key)
 
-# DE-DUPE BY LINK
-seen = set()
-unique = []
-for job in combined:
-    if job["link"] not in seen:
-        unique.append(job)
-        seen.add(job["link"])
+    # one consistent category for every source (only fills missing types)
+    classify_jobs(unique)
+    # YYYY-MM-DD or null, whatever format each source used
+    normalize_jobs(unique)
 
-with open(OUT, "w") as f:
-    json.dump(unique, f, indent=2)
+    with open(out, "w") as f:
+        json.dump(unique, f, indent=2)
 
-print("✅ merged", len(tm), "TM +", len(yaf), "YAF")
-print("✅ unique total =", len(unique), "→", OUT)
+    print("✅ merged", len(tm), "TM +", len(yaf), "YAF")
+    print("✅ unique total =", len(unique), "→", out)
+    return unique
 
+if __name__ == "__main__":
+    merge()
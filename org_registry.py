@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Compiled org registry: the spreadsheet is read once per edit, not once per run.
+
+- compile_workbook() walks every sheet of the workbook (Numbers exports put an
+  "Export Summary" sheet first) with openpyxl in read-only mode, finds each
+  sheet's header row and org / careers-URL columns once, and keeps the rows
+- The result is stored in .cache/org_registry.json together with the
+  workbook's size, mtime and SHA-256; load() returns the stored orgs while
+  those still match (a touched but unchanged file is re-hashed, not re-read)
+- No pandas: a registry hit is a single json.load
+
+Usage:
+    import org_registry
+    orgs = org_registry.load("Job boards list.xlsx")   # [{"org": ..., "url": ...}, ...]
+    python org_registry.py ["Job boards list.xlsx"] [--rebuild]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+REGISTRY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "org_registry.json")
+WORKBOOK = "Job boards list.xlsx"
+VERSION = 1
+
+ORG_KEYS = ["employer", "organization", "company", "org"]
+URL_KEYS = ["career", "job", "url", "link"]
+HEADER_SCAN_ROWS = 25   # metadata rows Numbers/Excel exports put above the header
+
+stats = {"source": None, "seconds": 0.0}
+
+
+class RegistryError(ValueError):
+    pass
+
+
+def _cell(v) -> str:
+    return "" if v is None else str(v).strip()
+
+
+def _matches(text: str, keys: Sequence[str]) -> bool:
+    return any(k in text for k in keys)
+
+
+def _looks_like_url(v: str) -> bool:
+    return v.startswith(("http://", "https://", "www."))
+
+
+def detect_columns(header: Sequence, rows: Sequence[Sequence]) -> Tuple[Optional[int], Optional[int]]:
+    """(org column, URL column) by header keyword; the URL column must actually hold URLs."""
+    names = [_cell(h).lower() for h in header]
+    org_col = next((i for i, n in enumerate(names) if n and _matches(n, ORG_KEYS)), None)
+    candidates = [i for i, n in enumerate(names) if n and i != org_col and _matches(n, URL_KEYS)]
+    for i in candidates:
+        # "Jobs Currently Available?" matches "job" too, but holds Yes/No
+        if any(_looks_like_url(_cell(r[i])) for r in rows if i < len(r)):
+            return org_col, i
+    return org_col, candidates[0] if candidates else None
+
+
+def read_sheet(rows: List[Sequence]) -> Optional[Dict]:
+    """Header position, columns and org rows of one sheet, or None if it has no org/URL header."""
+    for h, header in enumerate(rows[:HEADER_SCAN_ROWS]):
+        text = " ".join(_cell(x).lower() for x in header)
+        if not (_matches(text, ORG_KEYS) and _matches(text, URL_KEYS)):
+            continue
+        body = rows[h + 1:]
+        org_col, url_col = detect_columns(header, body)
+        if org_col is None or url_col is None:
+            continue
+        orgs = []
+        for r in body:
+            org = _cell(r[org_col]) if org_col < len(r) else ""
+            url = _cell(r[url_col]) if url_col < len(r) else ""
+            if org and url and url.lower() != "nan":
+                orgs.append({"org": org, "url": url})
+        return {"header_row": h, "org_column": _cell(header[org_col]),
+                "url_column": _cell(header[url_col]), "orgs": orgs}
+    return None
+
+
+def compile_workbook(path: str) -> Dict:
+    """Read every sheet of `path` and return the registry (without the file fingerprint)."""
+    from openpyxl import load_workbook   # only needed when the workbook changed
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets, orgs, seen = [], [], set()
+        for ws in wb.worksheets:
+            found = read_sheet(list(ws.iter_rows(values_only=True)))
+            if not found:
+                continue
+            fresh = [o for o in found.pop("orgs") if (o["org"], o["url"]) not in seen]
+            seen.update((o["org"], o["url"]) for o in fresh)
+            orgs.extend(fresh)
+            sheets.append({"sheet": ws.title, "rows": len(fresh), **found})
+    finally:
+        wb.close()
+    if not sheets:
+        raise RegistryError("Could not find an org/URL header row on any sheet.")
+    return {"sheets": sheets, "orgs": orgs}
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _read_registry(registry_path: str) -> Optional[Dict]:
+    try:
+        with open(registry_path, encoding="utf-8") as f:
+            reg = json.load(f)
+    except Exception:
+        return None
+    return reg if reg.get("version") == VERSION else None
+
+
+def _write_registry(reg: Dict, registry_path: str):
+    try:
+        os.makedirs(os.path.dirname(registry_path), exist_ok=True)
+        tmp = registry_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(reg, f, ensure_ascii=False)
+        os.replace(tmp, registry_path)
+    except OSError:
+        pass
+
+
+def load(path: str = WORKBOOK, registry_path: str = REGISTRY_PATH, rebuild: bool = False) -> List[Dict]:
+    """Orgs from the compiled registry, recompiling only when the workbook changed."""
+    started = time.perf_counter()
+    st = os.stat(path)
+    source = os.path.abspath(path)
+    reg = None if rebuild else _read_registry(registry_path)
+
+    if reg and reg["source"] == source and reg["size"] == st.st_size:
+        if reg["mtime_ns"] == st.st_mtime_ns:
+            stats["source"] = "registry"
+        elif reg["sha256"] == file_hash(path):
+            reg["mtime_ns"] = st.st_mtime_ns   # touched / re-saved without edits
+            _write_registry(reg, registry_path)
+            stats["source"] = "registry (re-hashed)"
+        else:
+            reg = None
+    else:
+        reg = None
+
+    if reg is None:
+        reg = {"version": VERSION, "source": source, "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+               "sha256": file_hash(path), "compiled_at": time.time(), **compile_workbook(path)}
+        _write_registry(reg, registry_path)
+        stats["source"] = "workbook"
+
+    stats["seconds"] = time.perf_counter() - started
+    return reg["orgs"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(description="Compile the org spreadsheet into the cached registry")
+    p.add_argument("workbook", nargs="?", default=WORKBOOK)
+    p.add_argument("--rebuild", action="store_true", help="recompile even if the workbook is unchanged")
+    args = p.parse_args(argv)
+    try:
+        orgs = load(args.workbook, rebuild=args.rebuild)
+    except (OSError, RegistryError) as e:
+        print(f"❌ {e}")
+        return 1
+    reg = _read_registry(REGISTRY_PATH) or {}
+    for s in reg.get("sheets", []):
+        print(f"📄 {s['sheet']}: header row {s['header_row'] + 1}, "
+              f"'{s['org_column']}' / '{s['url_column']}', {s['rows']} orgs")
+    print(f"✅ {len(orgs)} orgs from {stats['source']} in {stats['seconds'] * 1000:.1f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
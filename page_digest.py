@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Content-hash change detection for listing pages.
+
+- Hashes a *normalized* body per URL: nonces, CSRF tokens, cache-busting
+  ?ver= params, generator/timing comments and whitespace are stripped first
+- If the hash matches last run, the jobs extracted last run are returned and
+  the page is not parsed again (BeautifulSoup is the dominant CPU cost)
+- Cache only what the page itself says: per-run values (today's date as a
+  fallback, the registry's org name) are filled in after the lookup
+- Stored in .cache/page_digests.json (a link_cache.TTLCache): entries older
+  than TTL are parsed again, above MAX_ENTRIES the oldest are dropped on save
+
+Usage:
+    import page_digest
+    jobs = page_digest.reuse_or_parse(url, resp.text, parse_listing)
+"""
+
+import atexit
+import hashlib
+import re
+import threading
+from typing import Any, Callable, Dict, Union
+
+import link_cache
+
+TTL = 7 * link_cache.DAY
+MAX_ENTRIES = 5000
+
+# Per-request noise that changes on every load without changing the listings
+NOISE_PATTERNS = [
+    re.compile(r"<!--.*?-->", re.S),                                          # generator / timing / cache comments
+    re.compile(r'\snonce="[^"]*"', re.I),                                     # CSP script nonces
+    re.compile(r'"(?:nonce|_wpnonce|wpnonce|csrf[_-]?token)"\s*:\s*"[^"]*"', re.I),
+    re.compile(r'(_wpnonce|nonce|csrf[_-]?token)=[A-Za-z0-9_\-]+', re.I),
+    re.compile(r'<meta[^>]+name="csrf[^"]*"[^>]*>', re.I),
+    re.compile(r'<input[^>]+name="[^"]*(?:csrf|token|nonce)[^"]*"[^>]*>', re.I),
+    re.compile(r'([?&](?:ver|v|_)=)[A-Za-z0-9.\-]+', re.I),                  # cache-busting asset params
+    re.compile(r"\s+"),
+]
+
+
+def normalize(body: Union[str, bytes]) -> str:
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "ignore")
+    for pat in NOISE_PATTERNS:
+        body = pat.sub(" ", body)
+    return body.strip()
+
+
+def digest(body: Union[str, bytes]) -> str:
+    return hashlib.sha256(normalize(body).encode("utf-8")).hexdigest()
+
+
+class DigestStore:
+    def __init__(self, name: str = "page_digests", ttl: float = TTL, max_entries: int = MAX_ENTRIES,
+                 root: str = link_cache.CACHE_DIR):
+        self.cache = link_cache.TTLCache(name, ttl=ttl, max_entries=max_entries, root=root)
+        self.lock = threading.Lock()
+        self.stats = {"reused": 0, "parsed": 0}
+
+    def reuse_or_parse(self, key: str, body: Union[str, bytes], parse: Callable[[], Any]) -> Any:
+        """
+        Return last run's result for `key` if its normalized body hash is
+        unchanged (and the entry is younger than the TTL), otherwise call
+        parse() and remember its result.
+        """
+        h = digest(body)
+        e = self.cache.get(key)
+        if e and e.get("hash") == h and "result" in e:
+            with self.lock:
+                self.stats["reused"] += 1
+            return e["result"]
+        result = parse()
+        self.cache.put(key, {"hash": h, "result": result})
+        with self.lock:
+            self.stats["parsed"] += 1
+        return result
+
+    def save(self):
+        try:
+            self.cache.save()
+        except TypeError:   # a parser returned something JSON can't hold
+            pass
+
+    def report(self) -> Dict[str, int]:
+        with self.lock:
+            return dict(self.stats, size=len(self.cache.entries))
+
+
+store = DigestStore()
+atexit.register(store.save)
+
+
+def reuse_or_parse(key: str, body: Union[str, bytes], parse: Callable[..., Any]) -> Any:
+    """`parse` is called with the body (as given) when the page changed."""
+    return store.reuse_or_parse(key, body, lambda: parse(body))
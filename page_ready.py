@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Event-driven page readiness for the Selenium scrapers (instead of time.sleep).
+
+wait_ready(driver, ...) returns as soon as the page is usable:
+- document.readyState == "complete", then
+- selector: a CSS selector is present (the per-site default), or
+- "network-idle": no new resource entries for `quiet` seconds, or
+- "dom-stable": body HTML length unchanged for `quiet` seconds
+always bounded by `timeout`. Every wait is recorded per host, and a short
+summary is printed at exit (report() for the numbers).
+
+Usage:
+    import page_ready
+    page_ready.goto(driver, url, selector=".content-preview-card")
+"""
+
+import atexit
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+
+import fast_mode
+
+POLL = 0.1
+DEFAULT_TIMEOUT = 10
+DEFAULT_QUIET = 0.5
+
+NETWORK_IDLE = "network-idle"
+DOM_STABLE = "dom-stable"
+
+PROBES = {
+    NETWORK_IDLE: "return performance.getEntriesByType('resource').length",
+    DOM_STABLE: "return document.body ? document.body.innerHTML.length : 0",
+}
+
+timings: Dict[str, List[float]] = {}
+_lock = threading.Lock()
+
+
+def _record(driver, waited: float):
+    try:
+        host = urlparse(driver.current_url).hostname or "?"
+    except Exception:
+        host = "?"
+    with _lock:
+        timings.setdefault(host, []).append(waited)
+
+
+def wait_ready(driver, selector: Optional[str] = None, condition: str = DOM_STABLE,
+               timeout: float = DEFAULT_TIMEOUT, quiet: float = DEFAULT_QUIET) -> float:
+    """Block until the current page is ready (see module doc); returns seconds waited."""
+    started = time.monotonic()
+    deadline = started + timeout
+
+    def expired():
+        return time.monotonic() >= deadline
+
+    while not expired():
+        try:
+            if driver.execute_script("return document.readyState") == "complete":
+                break
+        except Exception:
+            pass
+        time.sleep(POLL)
+
+    if selector:
+        while not expired():
+            try:
+                if driver.execute_script("return !!document.querySelector(arguments[0])", selector):
+                    break
+            except Exception:
+                pass
+            time.sleep(POLL)
+    else:
+        probe = PROBES[condition]
+        last, since = None, time.monotonic()
+        while not expired():
+            try:
+                value = driver.execute_script(probe)
+            except Exception:
+                value = None
+            now = time.monotonic()
+            if value != last:
+                last, since = value, now
+            elif now - since >= quiet:
+                break
+            time.sleep(POLL)
+
+    waited = time.monotonic() - started
+    _record(driver, waited)
+    return waited
+
+
+def goto(driver, url: str, selector: Optional[str] = None, condition: str = DOM_STABLE,
+         timeout: float = DEFAULT_TIMEOUT, quiet: float = DEFAULT_QUIET) -> float:
+    """driver.get(url) followed by wait_ready(); returns seconds spent waiting.
+
+    On fast-mode browsers the site's resource block list is installed first.
+    """
+    fast_mode.apply(driver, url)
+    driver.get(url)
+    waited = wait_ready(driver, selector=selector, condition=condition, timeout=timeout, quiet=quiet)
+    fast_mode.measure(driver)
+    return waited
+
+
+def report() -> Dict[str, Dict[str, float]]:
+    with _lock:
+        return {
+            host: {"pages": len(ts), "avg": round(sum(ts) / len(ts), 2), "max": round(max(ts), 2)}
+            for host, ts in timings.items() if ts
+        }
+
+
+@atexit.register
+def print_report():
+    for host, r in sorted(report().items()):
+        print(f"⏱️  {host}: {r['pages']} pages ready in avg {r['avg']}s (max {r['max']}s)")
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Pagination helpers: find the last page once, then fetch the rest concurrently.
+
+- last_page_from_links(hrefs): highest /page/N/ number among pagination links
+- probe_last_page(exists): galloping + binary search when a site shows no
+  page count (O(log n) probes instead of walking 1, 2, 3, ...)
+- stream(fetch, pages, workers): fetch pages on a thread pool and yield
+  (page, result) as each one finishes, so callers can process results
+  without waiting for the slowest page
+"""
+
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Iterable, Iterator, Tuple, TypeVar
+
+T = TypeVar("T")
+
+PAGE_RE = re.compile(r"/page/(\d+)/?")
+
+
+def last_page_from_links(hrefs: Iterable[str], pattern: re.Pattern = PAGE_RE) -> int:
+    """Highest page number linked from a pagination block, 0 if there is none."""
+    last = 0
+    for href in hrefs:
+        m = pattern.search(href or "")
+        if m:
+            last = max(last, int(m.group(1)))
+    return last
+
+
+def probe_last_page(exists: Callable[[int], bool], first: int = 1, limit: int = 1000) -> int:
+    """
+    Last page n (first <= n <= limit) for which exists(n) is true, assuming
+    pages are contiguous. Returns first - 1 when even the first page is missing.
+    """
+    if not exists(first):
+        return first - 1
+    lo, hi, step = first, limit + 1, 1
+    # gallop: first, first+1, first+3, first+7, ... until a page is missing
+    while lo + step <= limit:
+        if exists(lo + step):
+            lo += step
+            step *= 2
+        else:
+            hi = lo + step
+            break
+    # binary search: lo exists, hi does not
+    while hi - lo > 1:
+        mid = (lo + hi) // 2
+        if exists(mid):
+            lo = mid
+        else:
+            hi = mid
+    return lo
+
+
+def stream(fetch: Callable[[int], T], pages: Iterable[int], workers: int = 4) -> Iterator[Tuple[int, T]]:
+    """Yield (page, fetch(page)) in completion order."""
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        futures = {pool.submit(fetch, p): p for p in pages}
+        for fut in as_completed(futures):
+            yield futures[fut], fut.result()
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+In-process host for scraper plugins.
+
+A plugin is any scraper_*.py in frontend/ or scrapers/ that defines a
+module-level `scrape() -> list[dict]`. The host imports each plugin once,
+gives it one shared, pooled requests.Session (swapped into the module's
+`session` global) and runs the plugins on a shared thread pool, so none of
+them pays interpreter startup or its own connection pool.
+
+- Discovery only imports files whose source defines `scrape`, so scripts that
+  still do their work at import time are never executed by accident
+- Each plugin is isolated: an exception is logged and reported, the others run on
+- Each plugin gets a wall-clock limit (--timeout): one still running after it
+  is reported as timed out and abandoned (its thread is a daemon and its
+  output is not written), and the shared session has a default request timeout
+- Two plugins never write the same output file: the first one found (frontend/
+  before scrapers/, alphabetical) keeps it, later ones are skipped with a note
+- Results are written to frontend/public/<the plugin's OUTPUT file name>, with
+  date_posted normalized to YYYY-MM-DD (or null)
+- Same summary table / run_report.json as scraper_runner.py, plus per-site
+  parse time (and peak memory with --trace-memory)
+
+Usage:
+    python plugin_host.py --jobs 8
+    python plugin_host.py --only acton ntu
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import re
+import threading
+import time
+import traceback
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import ModuleType
+from typing import Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter, Retry
+
+import dates
+import fast_mode
+import html_parser
+import jsonld
+import scraper_runner
+import tiered_fetch
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PLUGIN_DIRS = [os.path.join(ROOT, "frontend"), os.path.join(ROOT, "scrapers")]
+PUBLIC_DIR = os.path.join(ROOT, "frontend", "public")
+
+ENTRY_RE = re.compile(r"^(def scrape\(|scrape = )", re.M)
+OUTPUT_RE = re.compile(r"""^OUTPUT(?:_FILE)?\s*=\s*["']([^"']+)["']""", re.M)
+
+PLUGIN_TIMEOUT = scraper_runner.DEFAULT_TIMEOUT
+REQUEST_TIMEOUT = 30   # for plugin requests that pass no timeout of their own
+
+
+def output_name(name: str, declared: Optional[str]) -> str:
+    return os.path.basename(declared) if declared else f"jobs_{name}.json"
+
+
+def discover(dirs: List[str] = PLUGIN_DIRS, names: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    {plugin name: path} for scraper_*.py files that define scrape(), optionally
+    only `names`. A plugin whose output file is already claimed is skipped, so
+    concurrent runs never race on (and truncate) the same jobs_*.json.
+    """
+    found = {}
+    outputs = {}
+    for d in dirs:
+        if not os.path.isdir(d):
+            continue
+        for fn in sorted(os.listdir(d)):
+            if not (fn.startswith("scraper_") and fn.endswith(".py")):
+                continue
+            path = os.path.join(d, fn)
+            try:
+                with open(path, encoding="utf-8") as f:
+                    source = f.read()
+            except OSError:
+                continue
+            if not ENTRY_RE.search(source):
+                continue
+            name = fn[len("scraper_"):-3]
+            # frontend/ wins over scrapers/ when both have the same site
+            if name in found or (names and name not in names):
+                continue
+            m = OUTPUT_RE.search(source)
+            out = output_name(name, m.group(1) if m else None)
+            if out in outputs:
+                print(f"⚠️  skipping {os.path.relpath(path, ROOT)}: {out} is already written by {outputs[out]}")
+                continue
+            outputs[out] = name
+            found[name] = path
+    return found
+
+
+def load(name: str, path: str) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(f"cjb_plugin_{name}", path)
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+    return mod
+
+
+class TimeoutSession(requests.Session):
+    def __init__(self, timeout: float = REQUEST_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+def shared_session(pool_size: int) -> requests.Session:
+    s = TimeoutSession()
+    retries = Retry(total=3, backoff_factor=0.7, status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET", "POST"])
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=pool_size, pool_maxsize=pool_size)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+def output_path(name: str, mod: ModuleType) -> str:
+    declared = getattr(mod, "OUTPUT", None) or getattr(mod, "OUTPUT_FILE", None)
+    return os.path.join(PUBLIC_DIR, output_name(name, declared))
+
+
+def run_plugin(name: str, mod: ModuleType, write: bool = True,
+               abandoned: Optional[threading.Event] = None) -> Dict:
+    started = time.monotonic()
+    result = {"scraper": name, "timed_out": False, "jobs": None, "output_bytes": None,
+              "stdout": "", "stderr": ""}
+    try:
+        jobs = dates.normalize_jobs(mod.scrape() or [])
+        result["exit_code"] = 0
+        result["jobs"] = len(jobs)
+        if write and not (abandoned and abandoned.is_set()):
+            path = output_path(name, mod)
+            with open(path, "w") as f:
+                json.dump(jobs, f, indent=2)
+            result["output_bytes"] = os.path.getsize(path)
+    except Exception:
+        result["exit_code"] = 1
+        result["stderr"] = traceback.format_exc()
+    result["duration"] = round(time.monotonic() - started, 2)
+    return result
+
+
+def run_with_timeout(name: str, mod: ModuleType, write: bool = True, timeout: float = PLUGIN_TIMEOUT) -> Dict:
+    """
+    run_plugin() with a wall-clock limit. A thread cannot be killed, so a
+    plugin that overruns is abandoned: reported as timed out, its late result
+    discarded, and its daemon thread left to die with the interpreter.
+    """
+    started = time.monotonic()
+    abandoned = threading.Event()
+    box = {}
+    t = threading.Thread(target=lambda: box.update(result=run_plugin(name, mod, write, abandoned)),
+                         name=f"plugin-{name}", daemon=True)
+    t.start()
+    t.join(timeout)
+    if "result" in box:
+        return box["result"]
+    abandoned.set()
+    return {"scraper": name, "duration": round(time.monotonic() - started, 2), "exit_code": 1,
+            "timed_out": True, "jobs": None, "output_bytes": None, "stdout": "",
+            "stderr": f"no result after {timeout:.0f}s, abandoned"}
+
+
+def run_all(names: Optional[List[str]] = None, jobs: int = 4, write: bool = True,
+            report_path: Optional[str] = scraper_runner.REPORT_FILE,
+            timeout: float = PLUGIN_TIMEOUT) -> List[Dict]:
+    started = time.monotonic()
+    found = discover(names=names)
+
+    session = shared_session(max(10, jobs * 2))
+    plugins = {}
+    results = []
+    for name, path in found.items():
+        try:
+            mod = load(name, path)
+        except Exception:
+            results.append({"scraper": name, "duration": 0.0, "exit_code": 1, "timed_out": False, "jobs": None,
+                            "output_bytes": None, "stdout": "", "stderr": traceback.format_exc()})
+            continue
+        if hasattr(mod, "session"):
+            mod.session = session
+        plugins[name] = mod
+
+    print(f"🔌 {len(plugins)} plugins loaded, running {jobs} at a time\n")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(run_with_timeout, name, mod, write, timeout) for name, mod in plugins.items()]
+        for fut in as_completed(futures):
+            r = fut.result()
+            scraper_runner.print_result(r)
+            results.append(r)
+
+    wall = time.monotonic() - started
+    results.sort(key=lambda r: r["scraper"])
+    scraper_runner.print_summary(results, wall)
+    if report_path:
+        scraper_runner.write_report(results, wall, report_path, {"browser_traffic": fast_mode.report(),
+                                                                 "fetch_tiers": tiered_fetch.tiers(),
+                                                                 "parse": html_parser.report(),
+                                                                 "jsonld": jsonld.report()})
+    return results
+
+
+def main(argv: Optional[List[str]] = None):
+    p = argparse.ArgumentParser(description="Run scraper plugins in one process")
+    p.add_argument("--jobs", "-j", type=int, default=4, help="plugins to run at once (default 4)")
+    p.add_argument("--only", nargs="*", help="plugin names, e.g. acton ntu")
+    p.add_argument("--no-write", action="store_true", help="do not write jobs_*.json files")
+    p.add_argument("--timeout", type=float, default=PLUGIN_TIMEOUT,
+                   help=f"per-plugin wall-clock limit in seconds (default {PLUGIN_TIMEOUT})")
+    p.add_argument("--report", default=scraper_runner.REPORT_FILE, help="where to write the JSON run report")
+    p.add_argument("--trace-memory", action="store_true", help="record peak memory per parse (slower)")
+    args = p.parse_args(argv)
+    if args.trace_memory:
+        tracemalloc.start()
+    run_all(args.only, jobs=args.jobs, write=not args.no_write, report_path=args.report, timeout=args.timeout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Per-host politeness scheduler shared by scraper.py and the per-site scrapers.
+
+- One token bucket per hostname (rate = requests/second, burst = bucket size)
+- HOST_RULES tightens or loosens specific hosts (matched by hostname suffix),
+  e.g. shared ATS hosts like *.icims.com that many orgs live on
+- robots.txt Crawl-delay is honoured when it is stricter than the configured rate
+- Thread-safe: callers on a thread pool reserve a slot under a lock and sleep
+  outside it, so one slow host never blocks the others
+
+Usage:
+    import ratelimit
+    ratelimit.wait(url)          # blocks until `url`'s host may be hit again
+"""
+
+import threading
+import time
+import urllib.request
+from typing import Dict, Optional, Tuple
+from urllib import robotparser
+from urllib.parse import urlparse
+
+UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X) ConservativeJobsBoardBot/1.0 (+contact: site owner)"
+
+DEFAULT_RATE = 2.0    # requests per second per host
+DEFAULT_BURST = 4
+ROBOTS_TIMEOUT = 10
+
+# hostname suffix -> (rate, burst). Longest matching suffix wins.
+HOST_RULES: Dict[str, Tuple[float, int]] = {
+    "icims.com": (0.5, 1),                  # shared by many orgs
+    "recruiting.paylocity.com": (0.5, 1),   # shared by many orgs
+    "myworkdayjobs.com": (4.0, 4),          # paginated CXS pages fetched in parallel
+    "bamboohr.com": (1.0, 2),
+    "talentmarket.org": (1.0, 2),           # one detail page per job card
+    "yaf.org": (1.0, 2),
+}
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: int):
+        self.rate = max(rate, 1e-6)
+        self.burst = max(burst, 1)
+        self.tokens = float(self.burst)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must sleep before using it."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    def slow_down(self, factor: float = 2.0):
+        with self.lock:
+            self.rate = max(self.rate / factor, 1e-3)
+
+
+class HostRateLimiter:
+    def __init__(self, rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST,
+                 rules: Optional[Dict[str, Tuple[float, int]]] = None,
+                 respect_robots: bool = True, user_agent: str = UA):
+        self.rate = rate
+        self.burst = burst
+        self.rules = dict(HOST_RULES if rules is None else rules)
+        self.respect_robots = respect_robots
+        self.user_agent = user_agent
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.waited: Dict[str, float] = {}
+        self.lock = threading.Lock()
+
+    def limits_for(self, host: str) -> Tuple[float, int]:
+        best = None
+        for suffix, limits in self.rules.items():
+            if host == suffix or host.endswith("." + suffix):
+                if best is None or len(suffix) > len(best[0]):
+                    best = (suffix, limits)
+        return best[1] if best else (self.rate, self.burst)
+
+    def crawl_delay(self, host: str, scheme: str = "https") -> Optional[float]:
+        """Crawl-delay for our user agent from the host's robots.txt, if any."""
+        req = urllib.request.Request(f"{scheme}://{host}/robots.txt", headers={"User-Agent": self.user_agent})
+        try:
+            with urllib.request.urlopen(req, timeout=ROBOTS_TIMEOUT) as resp:
+                lines = resp.read().decode("utf-8", "ignore").splitlines()
+        except Exception:
+            return None
+        rp = robotparser.RobotFileParser()
+        rp.parse(lines)
+        try:
+            delay = rp.crawl_delay(self.user_agent)
+        except Exception:
+            return None
+        return float(delay) if delay else None
+
+    def bucket(self, url: str) -> TokenBucket:
+        parsed = urlparse(url)
+        host = (parsed.hostname or url).lower()
+        with self.lock:
+            b = self.buckets.get(host)
+        if b:
+            return b
+
+        rate, burst = self.limits_for(host)
+        if self.respect_robots:
+            delay = self.crawl_delay(host, parsed.scheme or "https")
+            if delay and 1.0 / delay < rate:
+                rate, burst = 1.0 / delay, 1
+        with self.lock:
+            return self.buckets.setdefault(host, TokenBucket(rate, burst))
+
+    def wait(self, url: str) -> float:
+        """Block until the host of `url` may be requested again; returns seconds slept."""
+        delay = self.bucket(url).reserve()
+        if delay > 0:
+            time.sleep(delay)
+            host = (urlparse(url).hostname or url).lower()
+            with self.lock:
+                self.waited[host] = self.waited.get(host, 0.0) + delay
+        return delay
+
+    def backoff(self, url: str, factor: float = 2.0):
+        """Halve (by default) the rate for a host that answered 429/5xx after retries."""
+        self.bucket(url).slow_down(factor)
+
+
+limiter = HostRateLimiter()
+
+
+def configure(rate: float = DEFAULT_RATE, burst: int = DEFAULT_BURST, respect_robots: bool = True):
+    """Replace the shared limiter, e.g. from command-line flags."""
+    global limiter
+    limiter = HostRateLimiter(rate=rate, burst=burst, respect_robots=respect_robots)
+    return limiter
+
+
+def wait(url: str) -> float:
+    return limiter.wait(url)
+
+
+def backoff(url: str, factor: float = 2.0):
+    limiter.backoff(url, factor)
@@ -1,27 +1,11 @@
 import os
-import subprocess
-import sys
+
+import scraper_runner
 
 SCRAPER_DIR = "scrapers"
 
-def run_scraper(scraper_path):
-    print(f"▶️ Running {scraper_path} ...")
-    result = subprocess.run(
-        [sys.executable, scraper_path],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-    # Print standard output
-    if result.stdout:
-        print(result.stdout)
-    # Print any errors
-    if result.stderr:
-        print("⚠️ Errors:")
-        print(result.stderr)
-    print("----------------------------------------------------")
-
-def main():
+def main(argv=None):
+    args = scraper_runner.parse_args(argv)
     print("=========================================")
     print("     CONSERVATIVE JOBS BOARD SCRAPERS    ")
     print("=========================================\n")
@@ -41,11 +25,10 @@ def main():
     print(f"Found {len(scrapers)} scrapers:\n")
     for s in scrapers:
         print(f"  - {s}")
-    print("\nStarting runs...\n")
+    print(f"\nStarting runs ({args.jobs} at a time, {args.timeout:.0f}s timeout each)...\n")
 
-    for scraper in scrapers:
-        path = os.path.join(SCRAPER_DIR, scraper)
-        run_scraper(path)
+    paths = [os.path.join(SCRAPER_DIR, scraper) for scraper in scrapers]
+    scraper_runner.run_many(paths, os.getcwd(), jobs=args.jobs, timeout=args.timeout, report_path=args.report)
 
     print("\n🎉 ALL SCRAPERS FINISHED!")
     print("All JSON files should now be updated.\n")
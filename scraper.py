@@ -3,23 +3,48 @@
 
 """
 Conservative Jobs Board Scraper (stable)
-- Detects spreadsheet headers and columns automatically
-- Platform detection: iCIMS, BambooHR, Workday (generic), + AIER custom
+- Detects spreadsheet headers and columns automatically, once per workbook edit
+  (compiled into .cache/org_registry.json by org_registry.py)
+- Platform detection: iCIMS, BambooHR, Workday (generic), Paylocity, Greenhouse,
+  Lever, JazzHR, + AIER custom; vanity careers pages resolved to their
+  embedded ATS board (ats_discovery.py)
 - Robust network handling, timeouts, retries, error isolation
 - Never crashes: per-org try/except; fallbacks ensure a row is emitted
 - Output: jobs.json sorted newest-first (YYYY-MM-DD)
+- Optional asyncio crawl (--concurrency N) with a per-host concurrency cap
+- Per-host token-bucket politeness (ratelimit.py) instead of a global sleep
+- Conditional requests (ETag / Last-Modified) via an on-disk cache (http_cache.py)
+- Unchanged pages (normalized body hash) reuse last run's jobs (page_digest.py)
+- WordPress careers sites read through the REST API when exposed (wp_json.py)
 """
 
+import argparse
+import asyncio
+import html as html_lib
 import json
 import re
+import threading
 import time
-from datetime import datetime
-from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import urljoin, urlparse
+from xml.etree import ElementTree
 
-import pandas as pd
 import requests
 from requests.adapters import HTTPAdapter, Retry
-from bs4 import BeautifulSoup
+
+import ats_discovery
+import dates
+import html_parser
+import http_cache
+import jsonld
+import org_registry
+import page_digest
+import paginate
+import ratelimit
+import wp_json
+from job_types import classify
 
 # --- Quiet noisy warnings on some macOS Pythons (LibreSSL vs OpenSSL)
 try:
@@ -30,6 +55,12 @@ except Exception:
 
 UA = "Mozilla/5.0 (Macintosh; Intel Mac OS X) ConservativeJobsBoardBot/1.0 (+contact: site owner)"
 TIMEOUT = 25
+POOL_SIZE = 20
+PER_HOST_LIMIT = 2   # max orgs scraped at once against the same hostname
+GONE_STATUS = (404, 410)   # a resolved ATS board answering these has moved
+
+# per org (scrape_for_org's thread): did a request come back 404 / 410?
+request_state = threading.local()
 
 session = requests.Session()
 session.headers.update({"User-Agent": UA})
@@ -40,44 +71,77 @@ retries = Retry(
     status_forcelist=[429, 500, 502, 503, 504],
     allowed_methods=["GET", "POST"]
 )
-adapter = HTTPAdapter(max_retries=retries, pool_connections=20, pool_maxsize=20)
-session.mount("http://", adapter)
-session.mount("https://", adapter)
+
+def configure_pool(size: int = POOL_SIZE):
+    """(Re)mount the retrying adapter with a connection pool of `size` per host."""
+    adapter = HTTPAdapter(max_retries=retries, pool_connections=size, pool_maxsize=size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+configure_pool()
 
 def log(msg: str):
     print(msg, flush=True)
 
-def safe_get(url: str, **kwargs) -> Optional[requests.Response]:
+def safe_request(method: str, url: str, **kwargs) -> Optional[requests.Response]:
+    """
+    Rate-limited, retrying request through the shared session and the on-disk
+    conditional cache. A 304 comes back as the cached 200 (r.from_cache = True).
+    """
+    key = http_cache.cache.key(method, url, kwargs.get("json", kwargs.get("data")))
+    headers = {**http_cache.cache.validators(key), **(kwargs.pop("headers", None) or {})}
     try:
-        r = session.get(url, timeout=TIMEOUT, verify=False, **kwargs)
+        ratelimit.wait(url)
+        r = session.request(method, url, headers=headers, timeout=TIMEOUT, verify=False, **kwargs)
+        if r.status_code == 304:
+            cached = http_cache.cache.replay(key, r)
+            if cached is not None:
+                return cached
         r.raise_for_status()
+        r.cache_key = key
+        http_cache.cache.store(key, r)
         return r
+    except requests.exceptions.RetryError as e:
+        ratelimit.backoff(url)
+        log(f"❌ {method} failed (host throttled): {url} -> {e}")
+        return None
+    except requests.exceptions.HTTPError as e:
+        if e.response is not None and e.response.status_code in GONE_STATUS:
+            request_state.gone = True
+        log(f"❌ {method} failed: {url} -> {e}")
+        return None
     except Exception as e:
-        log(f"❌ GET failed: {url} -> {e}")
+        log(f"❌ {method} failed: {url} -> {e}")
         return None
 
+def safe_get(url: str, **kwargs) -> Optional[requests.Response]:
+    return safe_request("GET", url, **kwargs)
+
 def safe_post(url: str, **kwargs) -> Optional[requests.Response]:
-    try:
-        r = session.post(url, timeout=TIMEOUT, verify=False, **kwargs)
-        r.raise_for_status()
-        return r
-    except Exception as e:
-        log(f"❌ POST failed: {url} -> {e}")
-        return None
+    return safe_request("POST", url, **kwargs)
+
+def fetch_page(url: str) -> Optional[Tuple[str, str]]:
+    """(final URL, HTML) for ats_discovery, through the same cached, rate-limited session."""
+    r = safe_get(url)
+    return (r.url or url, r.text) if r is not None else None
+
+def parse_cached(r: requests.Response, org: str, parse: Callable[[requests.Response], List[Dict]]) -> List[Dict]:
+    """
+    Run parse(r), unless the normalized body hashes the same as last run for
+    this request -- then return last run's jobs (page_digest.py). Bodies
+    replayed from a 304 always match, so those are never re-parsed either.
+    Only what the page says is cached: the organization is set from `org`
+    after the lookup, and parsers leave unknown dates as None for
+    scrape_for_org to fill in with today's.
+    """
+    key = getattr(r, "cache_key", None) or r.url
+    jobs = page_digest.store.reuse_or_parse(
+        key, r.content, lambda: [{k: v for k, v in j.items() if k != "organization"} for j in parse(r)])
+    return [{**j, "organization": org} for j in jobs]
 
 def norm_date(s: Optional[str]) -> Optional[str]:
-    if not s:
-        return None
-    s = str(s).strip()
-    # prefer ISO or parse obvious formats; keep very defensive
-    try:
-        # Workday often yields ISO; others vary
-        dt = pd.to_datetime(s, errors="coerce", utc=True)
-        if pd.isna(dt):
-            return None
-        return dt.tz_convert(None).strftime("%Y-%m-%d") if hasattr(dt, "tz_convert") else dt.strftime("%Y-%m-%d")
-    except Exception:
-        return None
+    """YYYY-MM-DD or None (see dates.py)."""
+    return dates.normalize(s)
 
 def today_iso() -> str:
     return datetime.utcnow().strftime("%Y-%m-%d")
@@ -95,48 +159,184 @@ def detect_platform(url: str) -> str:
     # Custom: handle specific sites
     if "aier.org/careers" in u:
         return "AIER_Custom"
+    found = ats_discovery.signature(url)   # Paylocity / JazzHR / Greenhouse / Lever board URLs
+    if found:
+        return found["platform"]
     return "Custom"
 
+def resolve_platform(url: str) -> Tuple[str, str]:
+    """
+    (platform, URL to scrape). Vanity careers pages are resolved to the ATS
+    board they embed (ats_discovery.py, cached between runs), so only the
+    first run pays for fetching the careers page.
+    """
+    found = ats_discovery.signature(url)   # already an ATS URL: scrape its canonical board
+    if found:
+        return found["platform"], found["board"]
+    platform = detect_platform(url)
+    if platform in ("Custom", "Workday"):
+        found = ats_discovery.resolve(url, fetch_page)
+        if found:
+            return found["platform"], found["board"]
+    return platform, url
+
 # ---------------- iCIMS ----------------
+"""
+One adapter for every iCIMS portal (careers-<tenant>.icims.com):
+1) GET /jobs/search?pr=0&schema=1&format=json&in_iframe=1 -- the structured
+   JSON listing where the portal serves it, else the bare iframe listing
+   (no site chrome around the rows)
+2) The first page gives the page count (JSON count, "Page 1 of N", or the
+   highest pr= link); pr=1..N-1 are fetched concurrently, at most
+   ICIMS_PAGE_LIMIT in flight, and parsed as they arrive
+3) Posted dates and locations come from the JSON fields or from each row's
+   "Posted Date" / "Job Locations" labels, not from today's date
+"""
+
+ICIMS_PAGE_LIMIT = 4     # concurrent page requests per portal
+ICIMS_MAX_PAGES = 50
+ICIMS_QUERY = "schema=1&format=json&in_iframe=1"
+
+# only the listing is built, not the portal's header / footer
+ICIMS_LISTING = ".iCIMS_JobsTable, .iCIMS_JobListing, .iCIMS_Listings, .iCIMS_MainWrapper, div.row"
+ICIMS_JOB_HREF_RE = re.compile(r"/jobs/\d+/")
+ICIMS_PAGES_RE = re.compile(r"Page\s+\d+\s+of\s+(\d+)", re.I)
+ICIMS_PR_RE = re.compile(r"[?&]pr=(\d+)")
+US_DATE_IN_TEXT_RE = re.compile(r"\d{1,2}/\d{1,2}/\d{4}")
+
+# JSON field names seen across portals, compared lower-cased
+ICIMS_FIELDS = {
+    "title": ("title", "jobtitle", "name"),
+    "link": ("url", "link", "joburl", "portalurl"),
+    "location": ("joblocation", "location", "locations", "joblocations"),
+    "date": ("dateposted", "posteddate", "postingdate", "datecreated", "updateddate"),
+    "type": ("employmenttype", "positiontype", "jobtype", "type"),
+}
+
+def icims_base(url: str) -> Optional[str]:
+    m = re.match(r"(https?://[^/]+\.icims\.com)", url, re.I)
+    return m.group(1).lower() if m else None
+
+def icims_page(base: str, pr: int) -> Optional[requests.Response]:
+    # query string inline, so each page gets its own conditional-cache entry
+    return safe_get(f"{base}/jobs/search?pr={pr}&{ICIMS_QUERY}")
+
 def scrape_icims(org: str, career_url: str) -> List[Dict]:
-    res = []
-    r = safe_get(career_url)
+    base = icims_base(career_url)
+    if not base:
+        return []
+    r = icims_page(base, 0)
     if not r:
-        return res
-    soup = BeautifulSoup(r.text, "html.parser")
-
-    # Newer iCIMS implementations can use cards/listings with various classes
-    cards = soup.select("div.iCIMS_JobListing, div.row, li[class*='job'], div[class*='search-result']")
-    if not cards:
-        # fallback: any anchor under the listing container
-        cards = soup.select("a.iCIMS_Anchor, .iCIMS_Listings a, .search-results a")
-
-    for c in cards:
-        # Try to find anchor
-        a = c if c.name == "a" else c.find("a", href=True)
-        if not a:
+        return []
+    pages = {0: parse_cached(r, org, lambda r: parse_icims(org, base, r))}
+
+    total = min(icims_page_count(r), ICIMS_MAX_PAGES)
+    if total > 1:
+        log(f"   iCIMS: {total} pages, fetching {total - 1} more")
+        for pr, rp in paginate.stream(lambda pr: icims_page(base, pr), range(1, total), workers=ICIMS_PAGE_LIMIT):
+            if rp:
+                pages[pr] = parse_cached(rp, org, lambda rp: parse_icims(org, base, rp))
+
+    # keep the portal's own ordering regardless of arrival order
+    return [j for pr in sorted(pages) for j in pages[pr]]
+
+def icims_json(r: requests.Response):
+    """Parsed JSON body, or None when the portal answered with HTML."""
+    if "json" not in r.headers.get("Content-Type", "") and not r.text.lstrip().startswith(("{", "[")):
+        return None
+    try:
+        return r.json()
+    except ValueError:
+        return None
+
+def icims_json_jobs(data) -> Optional[List[Dict]]:
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ("jobs", "results", "searchResults", "items"):
+            if isinstance(data.get(key), list):
+                return data[key]
+    return None
+
+def icims_page_count(r: requests.Response) -> int:
+    data = icims_json(r)
+    if isinstance(data, dict):
+        for key in ("totalPages", "pageCount", "pages"):
+            try:
+                return int(data[key])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return 1
+    m = ICIMS_PAGES_RE.search(r.text)
+    if m:
+        return int(m.group(1))
+    # pr= is zero-based
+    return paginate.last_page_from_links(re.findall(r'href="([^"]*pr=\d+[^"]*)"', r.text), ICIMS_PR_RE) + 1
+
+def parse_icims(org: str, base: str, r: requests.Response) -> List[Dict]:
+    items = icims_json_jobs(icims_json(r))
+    if items is not None:
+        return [icims_json_job(org, base, item) for item in items if isinstance(item, dict)]
+    return parse_icims_html(org, base, r.text)
+
+def _icims_field(item: Dict, field: str):
+    lowered = {k.lower(): v for k, v in item.items()}
+    return next((lowered[k] for k in ICIMS_FIELDS[field] if lowered.get(k)), None)
+
+def _icims_location(place: str, text: str = "") -> str:
+    # remote roles are listed as e.g. "US-Virtual" or only say so in the summary
+    if "virtual" in place.lower() or "virtual" in text.lower():
+        return "Virtual"
+    return place or "N/A"
+
+def icims_json_job(org: str, base: str, item: Dict) -> Dict:
+    link = str(_icims_field(item, "link") or base)
+    return {
+        "title": html_lib.unescape(str(_icims_field(item, "title") or "Untitled")).strip(),
+        "organization": org,
+        "location": _icims_location(jsonld.place(_icims_field(item, "location"))),
+        "type": str(_icims_field(item, "type") or "N/A").replace("_", " ").title(),
+        "date_posted": norm_date(_icims_field(item, "date")),
+        "link": urljoin(base + "/", link),
+    }
+
+def _icims_labels(row) -> Dict[str, object]:
+    """{"job locations": <span>, "posted date": <span>, ...} from a row's screen-reader labels."""
+    labels = {}
+    for label in row.select("span.sr-only, .field-label"):
+        value = label.find_next_sibling(["span", "div"]) or label.find_next("span")
+        if value is not None:
+            labels[label.get_text(" ", strip=True).lower()] = value
+    return labels
+
+def parse_icims_html(org: str, base: str, html: str) -> List[Dict]:
+    soup = html_parser.parse(html, only=[ICIMS_LISTING], label="icims")
+    res, seen = [], set()
+    for a in soup.select("a.iCIMS_Anchor[href], a[href*='/jobs/']"):
+        href = a.get("href", "")
+        if not ICIMS_JOB_HREF_RE.search(href):
             continue
-        title = a.get_text(strip=True) or "Untitled"
-        link = a["href"]
-        if link.startswith("/"):
-            # Build absolute from base
-            from urllib.parse import urljoin
-            link = urljoin(career_url, link)
-
-        # Try to find location/type in siblings/text
-        txt = c.get_text(" ", strip=True)
-        # naive extraction
-        loc_match = re.search(r"Location[:\s]+(.+?)(?:\s{2,}|$)", txt, flags=re.I)
-        jobtype_match = re.search(r"(Full[-\s]?time|Part[-\s]?time|Internship|Fellowship|Contract)", txt, flags=re.I)
-        loc = loc_match.group(1).strip() if loc_match else "N/A"
-        job_type = jobtype_match.group(1).strip().title() if jobtype_match else "N/A"
+        link = urljoin(base + "/", href).split("?")[0]
+        if link in seen:
+            continue
+        seen.add(link)
+
+        row = a.find_parent("div", class_="row") or a.find_parent("li") or a.parent
+        labels = _icims_labels(row)
+        place = labels.get("job locations") or labels.get("location")
+        posted = labels.get("posted date") or labels.get("date posted")
+        posted_text = (posted.get("title") or posted.get_text(" ", strip=True)) if posted else ""
+        m = US_DATE_IN_TEXT_RE.search(posted_text)
+        summary = row.select_one(".description")
 
+        title = (a.find(["h3", "h2"]) or a).get_text(" ", strip=True)
         res.append({
-            "title": title,
+            "title": title or "Untitled",
             "organization": org,
-            "location": loc,
-            "type": job_type,
-            "date_posted": today_iso(),   # iCIMS list pages often omit dates; detailed pages may include them
+            "location": _icims_location(place.get_text(" ", strip=True) if place else "",
+                                        summary.get_text(" ", strip=True) if summary else ""),
+            "type": "N/A",
+            "date_posted": norm_date(m.group(0) if m else posted_text),
             "link": link
         })
     return res
@@ -148,14 +348,17 @@ def bamboo_subdomain(u: str) -> Optional[str]:
     return m.group(1) if m else None
 
 def scrape_bamboohr(org: str, career_url: str) -> List[Dict]:
-    res = []
     sub = bamboo_subdomain(career_url)
     if not sub:
-        return res
+        return []
     api = f"https://{sub}.bamboohr.com/careers/list?format=json"
     r = safe_get(api)
     if not r:
-        return res
+        return []
+    return parse_cached(r, org, lambda r: parse_bamboohr(org, career_url, r))
+
+def parse_bamboohr(org: str, career_url: str, r: requests.Response) -> List[Dict]:
+    res = []
     try:
         data = r.json()
     except Exception:
@@ -166,7 +369,7 @@ def scrape_bamboohr(org: str, career_url: str) -> List[Dict]:
             "organization": org,
             "location": (j.get("location") or "N/A").strip(),
             "type": (j.get("jobOpeningType") or "N/A").strip(),
-            "date_posted": norm_date(j.get("publishedDate")) or today_iso(),
+            "date_posted": norm_date(j.get("publishedDate")),
             "link": j.get("jobOpeningUrl") or career_url
         })
     return res
@@ -175,28 +378,24 @@ def scrape_bamboohr(org: str, career_url: str) -> List[Dict]:
 """
 Approach:
 1) If URL already on myworkdayjobs.com, attempt /wday/cxs/{tenant}/{site}/jobs search API.
-2) If not, fetch HTML and search for an embedded myworkdayjobs.com link; use that as base.
-3) POST payload: {"limit":50,"offset":0,"searchText":""}
+2) If not, ats_discovery resolves the careers page to its myworkdayjobs.com
+   board once and remembers it, instead of re-fetching the page every run.
+3) POST payload: {"limit":20,"offset":0,"searchText":""}; the first page's
+   `total` tells us the remaining offsets, which are fetched concurrently
+   (at most WORKDAY_TENANT_LIMIT in flight) and parsed as they arrive.
 We gather title, jobPostingInfo -> locations / externalPath.
 """
 
-def find_myworkday_base(html: str) -> Optional[str]:
-    # Look for any https://*.myworkdayjobs.com/{tenant}/{site}
-    m = re.search(r"https://[a-z0-9\-.]+\.myworkdayjobs\.com/[^\"'\s<>]+", html, re.I)
-    return m.group(0) if m else None
+WORKDAY_PAGE_SIZE = 20       # most CXS tenants reject larger pages
+WORKDAY_TENANT_LIMIT = 4     # concurrent page requests per tenant
 
 def build_cxs_endpoint(base: str) -> Optional[str]:
-    # Convert ...myworkdayjobs.com/{tenant}/{site}/... -> .../wday/cxs/{tenant}/{site}/jobs
-    try:
-        parts = base.split("myworkdayjobs.com/")[1].split("/")
-        # Expect e.g. tenant/site
-        if len(parts) < 2:
-            return None
-        tenant = parts[0]
-        site = parts[1]
-        return f"https://{base.split('://',1)[1].split('/')[0]}/wday/cxs/{tenant}/{site}/jobs"
-    except Exception:
+    # Convert https://{tenant}.wdN.myworkdayjobs.com/[en-US/]{site}/... -> .../wday/cxs/{tenant}/{site}/jobs
+    found = ats_discovery.signature(base)
+    if not found or found["platform"] != "Workday":
         return None
+    host, site = found["board"].split("://", 1)[1].split("/", 1)
+    return f"https://{host}/wday/cxs/{host.split('.')[0]}/{site}/jobs"
 
 def scrape_workday(org: str, career_url: str) -> List[Dict]:
     res = []
@@ -205,9 +404,9 @@ def scrape_workday(org: str, career_url: str) -> List[Dict]:
     if "myworkdayjobs.com" in career_url:
         base = career_url
     else:
-        r0 = safe_get(career_url)
-        if r0 and r0.text:
-            base = find_myworkday_base(r0.text)
+        found = ats_discovery.resolve(career_url, fetch_page)
+        if found and found["platform"] == "Workday":
+            base = found["board"]
     if not base:
         return res
 
@@ -215,11 +414,35 @@ def scrape_workday(org: str, career_url: str) -> List[Dict]:
     if not cxs:
         return res
 
-    payload = {"limit": 50, "offset": 0, "searchText": ""}
-
-    r = safe_post(cxs, json=payload, headers={"Content-Type": "application/json"})
+    r = workday_page(cxs, 0)
     if not r:
         return res
+    pages = {0: parse_cached(r, org, lambda r: parse_workday(org, career_url, cxs, r))}
+
+    try:
+        total = int(r.json().get("total") or 0)
+    except Exception:
+        total = 0
+    offsets = list(range(WORKDAY_PAGE_SIZE, total, WORKDAY_PAGE_SIZE))
+    if offsets:
+        log(f"   Workday: {total} postings, fetching {len(offsets)} more pages")
+        with ThreadPoolExecutor(max_workers=min(WORKDAY_TENANT_LIMIT, len(offsets))) as pool:
+            futures = {pool.submit(workday_page, cxs, off): off for off in offsets}
+            # normalize each page as soon as it lands
+            for fut in as_completed(futures):
+                rp = fut.result()
+                if rp:
+                    pages[futures[fut]] = parse_cached(rp, org, lambda rp: parse_workday(org, career_url, cxs, rp))
+
+    # keep Workday's own ordering regardless of arrival order
+    return [j for off in sorted(pages) for j in pages[off]]
+
+def workday_page(cxs: str, offset: int) -> Optional[requests.Response]:
+    payload = {"appliedFacets": {}, "limit": WORKDAY_PAGE_SIZE, "offset": offset, "searchText": ""}
+    return safe_post(cxs, json=payload, headers={"Content-Type": "application/json"})
+
+def parse_workday(org: str, career_url: str, cxs: str, r: requests.Response) -> List[Dict]:
+    res = []
     try:
         data = r.json()
     except Exception:
@@ -232,11 +455,11 @@ def scrape_workday(org: str, career_url: str) -> List[Dict]:
         external_path = item.get("externalPath") or item.get("externalUrl") or ""
         link = None
         if external_path:
-            # base like https://<domain>.myworkdayjobs.com/{tenant}/{site}/job/<externalPath>
+            # https://<tenant>.wdN.myworkdayjobs.com/{site}<externalPath> (externalPath = /job/...)
             try:
-                dom = cxs.split("/wday/cxs/")[0]
-                tenant_site = cxs.split("/wday/cxs/")[1].split("/jobs")[0]
-                link = f"{dom}/{tenant_site}/job/{external_path}"
+                dom, tenant_site = cxs.split("/wday/cxs/")
+                site = tenant_site.split("/")[1]
+                link = f"{dom}/{site}/{external_path.lstrip('/')}"
             except Exception:
                 link = None
         link = link or career_url
@@ -247,7 +470,7 @@ def scrape_workday(org: str, career_url: str) -> List[Dict]:
             loc = ", ".join([str(x) for x in item["locations"] if x])
 
         # datePosted: often ISO
-        date_posted = norm_date(item.get("postedOn")) or norm_date(item.get("startDate")) or today_iso()
+        date_posted = norm_date(item.get("postedOn")) or norm_date(item.get("startDate"))
 
         # type/commitment not standardized; leave N/A
         res.append({
@@ -266,12 +489,27 @@ def scrape_aier(org: str, career_url: str) -> List[Dict]:
     """
     AIER WordPress careers page: extract obvious job listing anchors under content.
     We’ll pull <article> or main content links that look like postings.
+    The site's wp-json job post type is used instead when it exposes one.
     """
-    res = []
+    posts = wp_json.jobs(session, career_url, fetch=safe_get)
+    if posts:
+        return [{
+            "title": p["title"] or "Untitled",
+            "organization": org,
+            "location": p["location"] or "N/A",
+            "type": "N/A",
+            "date_posted": norm_date(p["date"]) or today_iso(),
+            "link": p["link"] or career_url
+        } for p in posts]
+
     r = safe_get(career_url)
     if not r:
-        return res
-    soup = BeautifulSoup(r.text, "html.parser")
+        return []
+    return parse_cached(r, org, lambda r: parse_aier(org, career_url, r.text))
+
+def parse_aier(org: str, career_url: str, html: str) -> List[Dict]:
+    res = []
+    soup = html_parser.parse(html, only=["main", "article", ".entry-content"], label="aier")
 
     # Heuristics: list items, content blocks under main with anchor text that isn't just 'Apply'
     anchors = soup.select("main a, article a, .entry-content a")
@@ -297,19 +535,203 @@ def scrape_aier(org: str, career_url: str) -> List[Dict]:
                 "organization": org,
                 "location": "N/A",
                 "type": "N/A",
-                "date_posted": today_iso(),
+                "date_posted": None,
                 "link": href
             })
 
     # If nothing matched, fallback
     if not res:
+        res = fallback_entry(org, career_url)
+    return res
+
+# ---------------- Paylocity ----------------
+# JSON list: https://recruiting.paylocity.com/recruiting/api/v2/companies/{id}/jobs (numeric company id)
+PAYLOCITY_API = "https://recruiting.paylocity.com/recruiting/api/v2/companies/{}/jobs"
+PAYLOCITY_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+                  "AppleWebKit/537.36 (KHTML, like Gecko) "
+                  "Chrome/115.0.0.0 Safari/537.36",
+    "Accept": "application/json",
+}
+
+# board page: /recruiting/jobs/All/{company guid}/{slug}; API: /recruiting/api/v2/companies/{id}/jobs
+PAYLOCITY_URL_RE = re.compile(r"paylocity\.com/recruiting/(?:jobs/all/([0-9a-f-]{36})(?:/([^/?#]+))?"
+                              r"|api/v2/companies/(\d+))", re.I)
+# The API only takes the numeric id; a board known by its GUID is read from
+# the board page itself, which carries its job list as window.pageData JSON
+PAYLOCITY_BOARD = "https://recruiting.paylocity.com/recruiting/jobs/All/{}"
+PAYLOCITY_PAGEDATA_RE = re.compile(r"window\.pageData\s*=\s*(\{.*?\})\s*;\s*(?:</script>|\n)", re.S)
+
+def paylocity_company(url: str) -> Optional[Tuple[str, Optional[str]]]:
+    """(company GUID or numeric id, board slug or None) from either Paylocity URL form."""
+    m = PAYLOCITY_URL_RE.search(url)
+    if not m:
+        return None
+    return (m.group(1), m.group(2)) if m.group(1) else (m.group(3), None)
+
+def scrape_paylocity(org: str, career_url: str) -> List[Dict]:
+    company = paylocity_company(career_url)
+    if not company:
+        return []
+    company_id, slug = company
+    slug = slug or re.sub(r"[^A-Za-z0-9]+", "-", org).strip("-")
+    if not company_id.isdigit():
+        r = safe_get(PAYLOCITY_BOARD.format(company_id))
+        if not r:
+            return []
+        return parse_cached(r, org, lambda r: parse_paylocity(org, slug, paylocity_board_jobs(r.text)))
+    data = fetch_paylocity(company_id)
+    if data is None:
+        return []
+    return parse_paylocity(org, slug, data)
+
+def fetch_paylocity(company_id: str) -> Optional[List[Dict]]:
+    """Raw Paylocity job list, or None when the API does not answer with JSON."""
+    r = safe_get(PAYLOCITY_API.format(company_id), headers=PAYLOCITY_HEADERS)
+    if not r:
+        return None
+    try:
+        data = r.json()
+    except Exception:
+        return None
+    return data if isinstance(data, list) else None
+
+def paylocity_board_jobs(html: str) -> List[Dict]:
+    """The board page's window.pageData jobs, in the API's field names."""
+    m = PAYLOCITY_PAGEDATA_RE.search(html)
+    if not m:
+        return []
+    try:
+        data = json.loads(m.group(1))
+    except ValueError:
+        return []
+    res = []
+    for j in data.get("Jobs") or [] if isinstance(data, dict) else []:
+        where = j.get("JobLocation") if isinstance(j.get("JobLocation"), dict) else {}
+        res.append({
+            "jobId": j.get("JobId"),
+            "title": j.get("JobTitle"),
+            "city": where.get("City") or j.get("LocationName"),
+            "state": where.get("State"),
+            "createdDate": j.get("PublishedDate"),
+        })
+    return res
+
+def parse_paylocity(org: str, slug: str, data: List[Dict]) -> List[Dict]:
+    res = []
+    for j in data:
+        place = ", ".join(str(j[k]).strip() for k in ("city", "state") if j.get(k) and str(j[k]).strip())
         res.append({
-            "title": "View Jobs",
+            "title": (j.get("title") or "N/A").strip(),
             "organization": org,
-            "location": "N/A",
+            "location": place or "N/A",
             "type": "N/A",
-            "date_posted": today_iso(),
-            "link": career_url
+            "date_posted": norm_date(j.get("createdDate")),
+            "link": f"https://recruiting.paylocity.com/recruiting/jobs/Details/{j.get('jobId') or j.get('id')}/{slug}"
+        })
+    return res
+
+# ---------------- Greenhouse ----------------
+# JSON list: https://boards-api.greenhouse.io/v1/boards/{token}/jobs?content=true
+# (content=true adds departments; the board token comes from ats_discovery)
+GREENHOUSE_API = "https://boards-api.greenhouse.io/v1/boards/{}/jobs?content=true"
+GREENHOUSE_RE = re.compile(r"greenhouse\.io/(?:v1/boards/|embed/job_board(?:/js)?\?for=)?([\w-]+)", re.I)
+
+def scrape_greenhouse(org: str, career_url: str) -> List[Dict]:
+    m = GREENHOUSE_RE.search(career_url)
+    if not m:
+        return []
+    r = safe_get(GREENHOUSE_API.format(m.group(1)))
+    if not r:
+        return []
+    return parse_cached(r, org, lambda r: parse_greenhouse(org, career_url, r))
+
+def parse_greenhouse(org: str, career_url: str, r: requests.Response) -> List[Dict]:
+    try:
+        data = r.json()
+    except Exception:
+        return []
+    res = []
+    for j in data.get("jobs", []):
+        title = (j.get("title") or "Untitled").strip()
+        departments = ", ".join(d["name"] for d in j.get("departments") or [] if d.get("name"))
+        res.append({
+            "title": title,
+            "organization": org,
+            "location": ((j.get("location") or {}).get("name") or "N/A").strip(),
+            "type": classify(title, departments, default="N/A"),
+            "date_posted": norm_date(j.get("first_published") or j.get("updated_at")),
+            "link": j.get("absolute_url") or career_url
+        })
+    return res
+
+# ---------------- Lever ----------------
+# JSON list: https://api.lever.co/v0/postings/{company}?mode=json
+LEVER_API = "https://api.lever.co/v0/postings/{}?mode=json"
+LEVER_RE = re.compile(r"lever\.co/(?:v0/postings/)?([\w.-]+)", re.I)
+
+def scrape_lever(org: str, career_url: str) -> List[Dict]:
+    m = LEVER_RE.search(career_url)
+    if not m:
+        return []
+    r = safe_get(LEVER_API.format(m.group(1)))
+    if not r:
+        return []
+    return parse_cached(r, org, lambda r: parse_lever(org, career_url, r))
+
+def parse_lever(org: str, career_url: str, r: requests.Response) -> List[Dict]:
+    try:
+        data = r.json()
+    except Exception:
+        return []
+    res = []
+    for j in data if isinstance(data, list) else []:
+        title = (j.get("text") or "Untitled").strip()
+        cats = j.get("categories") or {}
+        places = cats.get("allLocations") or [cats.get("location")]
+        created = j.get("createdAt")   # epoch milliseconds
+        res.append({
+            "title": title,
+            "organization": org,
+            "location": "; ".join(p for p in places if p) or "N/A",
+            "type": classify(title, cats.get("department"), cats.get("team"), default="N/A"),
+            "date_posted": norm_date(datetime.fromtimestamp(created / 1000, tz=timezone.utc)) if created else None,
+            "link": j.get("hostedUrl") or career_url
+        })
+    return res
+
+# ---------------- JazzHR / ApplyToJob ----------------
+# JazzHR's JSON API needs a customer key; its public syndication feed is XML:
+# https://app.jazz.co/feeds/export/jobs/{subdomain}, one <job> per opening
+JAZZHR_FEED = "https://app.jazz.co/feeds/export/jobs/{}"
+JAZZHR_RE = re.compile(r"([\w-]+)\.applytojob\.com", re.I)
+
+def scrape_jazzhr(org: str, career_url: str) -> List[Dict]:
+    m = JAZZHR_RE.search(career_url)
+    if not m:
+        return []
+    r = safe_get(JAZZHR_FEED.format(m.group(1).lower()))
+    if not r:
+        return []
+    return parse_cached(r, org, lambda r: parse_jazzhr(org, career_url, r))
+
+def parse_jazzhr(org: str, career_url: str, r: requests.Response) -> List[Dict]:
+    try:
+        root = ElementTree.fromstring(r.content)
+    except ElementTree.ParseError:
+        return []
+    res = []
+    for job in root.iter("job"):
+        f = {child.tag.lower(): (child.text or "").strip() for child in job}
+        title = f.get("title") or "Untitled"
+        place = ", ".join(p for p in (f.get("city"), f.get("state")) if p)
+        res.append({
+            "title": title,
+            "organization": org,
+            "location": place or f.get("country") or "N/A",
+            "type": classify(title, f.get("department"), default="N/A"),
+            "date_posted": norm_date(f.get("original_open_date") or f.get("date")),
+            "link": f.get("url") or f.get("apply_url") or career_url
         })
     return res
 
@@ -320,119 +742,165 @@ def fallback_entry(org: str, url: str) -> List[Dict]:
         "organization": org,
         "location": "N/A",
         "type": "N/A",
-        "date_posted": today_iso(),
+        "date_posted": None,   # today's, filled in by scrape_for_org
         "link": url
     }]
 
 # ---------------- Dispatch ----------------
-def scrape_for_org(org: str, url: str) -> List[Dict]:
-    platform = detect_platform(url)
-    log(f"🔎 {org}: {platform}")
+def scrape_for_org(org: str, url: str, resolved: Optional[Tuple[str, str]] = None) -> List[Dict]:
+    """Jobs for one org; `resolved` is resolve_platform(url) when the caller already has it."""
+    platform, board = "Custom", url
+    failed = False
     try:
+        platform, board = resolved or resolve_platform(url)
+        log(f"🔎 {org}: {platform}" + (f" ({board})" if board != url else ""))
+        request_state.gone = False
         if platform == "iCIMS":
-            out = scrape_icims(org, url)
+            out = scrape_icims(org, board)
         elif platform == "BambooHR":
-            out = scrape_bamboohr(org, url)
+            out = scrape_bamboohr(org, board)
         elif platform == "Workday":
-            out = scrape_workday(org, url)
+            out = scrape_workday(org, board)
+        elif platform == "Paylocity":
+            out = scrape_paylocity(org, board)
+        elif platform == "Greenhouse":
+            out = scrape_greenhouse(org, board)
+        elif platform == "Lever":
+            out = scrape_lever(org, board)
+        elif platform == "JazzHR":
+            out = scrape_jazzhr(org, board)
         elif platform == "AIER_Custom":
-            out = scrape_aier(org, url)
+            out = scrape_aier(org, board)
         else:
             out = fallback_entry(org, url)
     except Exception as e:
         log(f"❌ Scrape error for {org} ({platform}): {e}")
         out = fallback_entry(org, url)
-
-    # Normalize & harden
+        failed = True
+    if board != url and (failed or getattr(request_state, "gone", False)):
+        # board moved or gone: probe the careers page again next run (an
+        # empty board just has no openings and keeps its cached resolution)
+        ats_discovery.invalidate(url)
+
+    # Normalize & harden (dates in one batch: each distinct value parsed once)
+    posted = dates.normalize_many(j.get("date_posted") for j in out)
     cleaned = []
-    for j in out:
+    for j, d in zip(out, posted):
         cleaned.append({
             "title": str(j.get("title") or "View Jobs"),
             "organization": str(j.get("organization") or org),
             "location": str(j.get("location") or "N/A"),
             "type": str(j.get("type") or "N/A"),
-            "date_posted": norm_date(j.get("date_posted")) or today_iso(),
+            "date_posted": d or today_iso(),
             "link": str(j.get("link") or url)
         })
     return cleaned
 
 # ---------------- Excel ingestion ----------------
-def load_orgs_from_excel(path: str) -> List[Dict]:
+def load_orgs_from_excel(path: str, rebuild: bool = False) -> List[Dict]:
     """
     Returns list of dicts: [{"org": "...", "url": "..."}, ...]
-    Auto-detects header row and the org/url columns (employer|organization|company / career|job|url|link).
+    Served from the compiled registry (org_registry.py); the workbook is only
+    re-read, and its header row / org and URL columns re-detected, after it changes.
     """
-    # Read with no header; some Numbers exports include metadata rows
-    df = pd.read_excel(path, sheet_name=0, header=None)
-    # Find header row
-    header_row_idx = None
-    for i, row in df.iterrows():
-        row_str = " ".join(str(x).lower() for x in row if pd.notna(x))
-        if any(k in row_str for k in ["employer", "organization", "company", "org"]) and \
-           any(k in row_str for k in ["career", "job", "url", "link"]):
-            header_row_idx = i
-            break
-    if header_row_idx is None:
-        # fallback: try skipping first 10 rows and assume row 0 as header
-        df = pd.read_excel(path, sheet_name=0, header=None, skiprows=10)
-        if not df.empty:
-            header_row_idx = 0
-        else:
-            raise ValueError("Could not detect header row in spreadsheet.")
-
-    # Apply header and trim
-    df = pd.read_excel(path, sheet_name=0, header=None)  # reload raw
-    df.columns = df.iloc[header_row_idx]
-    df = df.drop(list(range(0, header_row_idx + 1))).dropna(how="all")
-
-    # Detect columns
-    norm = {c: str(c).strip().lower() for c in df.columns}
-    org_col = next((col for col, n in norm.items() if any(k in n for k in ["employer", "organization", "company", "org"])), None)
-    url_col = next((col for col, n in norm.items() if any(k in n for k in ["career", "job", "url", "link"])), None)
-    if not org_col or not url_col:
-        raise ValueError(f"Could not find org/URL columns. Found: {list(df.columns)}")
-
-    # Pull rows
-    df = df.dropna(subset=[org_col, url_col], how="any")
-    pairs = []
-    for _, row in df.iterrows():
-        org = str(row[org_col]).strip()
-        url = str(row[url_col]).strip()
-        if not org or not url or url.lower() == "nan":
-            continue
-        pairs.append({"org": org, "url": url})
-    return pairs
+    return org_registry.load(path, rebuild=rebuild)
 
-# ---------------- Main ----------------
-def main():
-    excel_path = "Job boards list.xlsx"  # keep exact name used earlier
-
-    try:
-        orgs = load_orgs_from_excel(excel_path)
-    except Exception as e:
-        log(f"❌ Spreadsheet problem: {e}")
-        log("Tip: Open your spreadsheet, delete the metadata rows above the actual headers, and re-save.")
-        return
-
-    log(f"📄 Loaded {len(orgs)} orgs from spreadsheet")
-
-    all_jobs: List[Dict] = []
-    seen = set()
+# ---------------- Crawl engines ----------------
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or url).lower()
 
+def scrape_sequential(orgs: List[Dict]) -> List[List[Dict]]:
+    results = []
     for idx, item in enumerate(orgs, 1):
         org, url = item["org"], item["url"]
         log(f"[{idx}/{len(orgs)}] {org} -> {url}")
-        jobs = scrape_for_org(org, url)
+        # politeness is enforced per host inside safe_get/safe_post
+        results.append(scrape_for_org(org, url))
+    return results
 
+async def scrape_concurrent(orgs: List[Dict], concurrency: int, per_host: int = PER_HOST_LIMIT) -> List[List[Dict]]:
+    """
+    Run scrape_for_org for many orgs at once on a thread pool.
+    At most `concurrency` orgs are in flight overall and at most `per_host`
+    against any one hostname -- the host of the board each careers page
+    resolves to, so orgs on a shared ATS host (myworkdayjobs.com,
+    boards.greenhouse.io, ...) share the cap. Results come back in spreadsheet
+    order so the dedupe in main() keeps exactly the same rows as a sequential run.
+    """
+    loop = asyncio.get_running_loop()
+    overall = asyncio.Semaphore(concurrency)
+    host_locks: Dict[str, asyncio.Semaphore] = {}
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        async def run_one(idx: int, item: Dict) -> List[Dict]:
+            org, url = item["org"], item["url"]
+            async with overall:
+                try:
+                    resolved = await loop.run_in_executor(pool, resolve_platform, url)
+                except Exception as e:
+                    log(f"❌ Could not resolve {url}: {e}")
+                    resolved = None   # scrape_for_org retries and falls back
+            per_host_sem = host_locks.setdefault(host_of(resolved[1] if resolved else url),
+                                                 asyncio.Semaphore(per_host))
+            async with per_host_sem, overall:
+                log(f"[{idx}/{len(orgs)}] {org} -> {url}")
+                return await loop.run_in_executor(pool, scrape_for_org, org, url, resolved)
+
+        return await asyncio.gather(*(run_one(i, item) for i, item in enumerate(orgs, 1)))
+
+def dedupe_jobs(results: List[List[Dict]]) -> List[Dict]:
+    all_jobs: List[Dict] = []
+    seen = set()
+    for jobs in results:
         for j in jobs:
             key = (j["title"], j["link"])
             if key in seen:
                 continue
             seen.add(key)
             all_jobs.append(j)
+    return all_jobs
+
+# ---------------- Main ----------------
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Conservative Jobs Board scraper")
+    p.add_argument("--concurrency", type=int, default=1,
+                   help="orgs to scrape at once (1 = sequential, the default)")
+    p.add_argument("--per-host", type=int, default=PER_HOST_LIMIT,
+                   help="max concurrent orgs against the same hostname")
+    p.add_argument("--rate", type=float, default=ratelimit.DEFAULT_RATE,
+                   help="default requests/second per host (see ratelimit.HOST_RULES for overrides)")
+    p.add_argument("--burst", type=int, default=ratelimit.DEFAULT_BURST,
+                   help="default token-bucket burst per host")
+    p.add_argument("--ignore-crawl-delay", action="store_true",
+                   help="do not read robots.txt Crawl-delay")
+    p.add_argument("--rebuild-registry", action="store_true",
+                   help="re-read the spreadsheet even if it has not changed")
+    return p.parse_args(argv)
+
+def main(argv: Optional[List[str]] = None):
+    args = parse_args(argv)
+    ratelimit.configure(args.rate, args.burst, respect_robots=not args.ignore_crawl_delay)
+    excel_path = "Job boards list.xlsx"  # keep exact name used earlier
+
+    try:
+        orgs = load_orgs_from_excel(excel_path, rebuild=args.rebuild_registry)
+    except Exception as e:
+        log(f"❌ Spreadsheet problem: {e}")
+        log("Tip: Open your spreadsheet, delete the metadata rows above the actual headers, and re-save.")
+        return
+
+    log(f"📄 Loaded {len(orgs)} orgs from {org_registry.stats['source']} "
+        f"in {org_registry.stats['seconds'] * 1000:.0f}ms")
+
+    started = time.monotonic()
+    if args.concurrency > 1:
+        log(f"⚡ Concurrent crawl: {args.concurrency} workers, {args.per_host} per host")
+        configure_pool(max(POOL_SIZE, args.concurrency))
+        results = asyncio.run(scrape_concurrent(orgs, args.concurrency, args.per_host))
+    else:
+        results = scrape_sequential(orgs)
 
-        # politeness delay
-        time.sleep(0.5)
+    all_jobs = dedupe_jobs(results)
 
     # Sort newest-first
     def sort_key(j):
@@ -448,11 +916,21 @@ def main():
 
     # Summary
     log("—" * 60)
-    log(f"✅ Saved {len(all_jobs)} jobs to jobs.json")
+    log(f"✅ Saved {len(all_jobs)} jobs to jobs.json in {time.monotonic() - started:.1f}s")
     by_org = {}
     for j in all_jobs:
         by_org.setdefault(j["organization"], 0)
         by_org[j["organization"]] += 1
+    c = http_cache.cache.report()
+    d = page_digest.store.report()
+    log(f"🗄️  HTTP cache: {c['hits']} hits (304), {c['misses']} misses, "
+        f"{c['bytes_saved'] / 1024:.0f} KiB not re-downloaded")
+    log(f"🧮 Unchanged pages: {d['reused']} parses skipped, {d['parsed']} parsed")
+    a = ats_discovery.report()
+    log(f"🎯 ATS discovery: {a['cached']} boards from cache, {a['probed']} careers pages probed "
+        f"({a['found']} resolved, {a['fetches']} fetches)")
+    for label, p in sorted(html_parser.report().items()):
+        log(f"🌳 Parsed {label}: {p['pages']} pages in {p['seconds']:.2f}s (max {p['max_seconds']:.3f}s)")
     top = sorted(by_org.items(), key=lambda x: x[1], reverse=True)[:10]
     log("Top orgs by jobs:")
     for org, n in top:
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Parallel runner for the per-site scraper scripts.
+
+- Runs scripts in a bounded worker pool (--jobs N), each in its own
+  subprocess / process group; scripts that write the same jobs_*.json file
+  name run one after another in a single worker, never at the same time
+- Per-scraper wall-clock timeout; on timeout the whole process group is
+  killed, so a hung Chrome/chromedriver goes with it
+- Summary table + JSON run report: duration, exit code, jobs emitted and
+  output bytes for every scraper
+
+Used by run_all_scrapers.py (scrapers/) and frontend/run_all_scrapers.py.
+"""
+
+import argparse
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PUBLIC_DIR = os.path.join(ROOT, "frontend", "public")
+DEFAULT_TIMEOUT = 600
+REPORT_FILE = "run_report.json"
+
+OUTPUT_RE = re.compile(r"""["']([\w./-]*jobs_\w+\.json)["']""")
+
+
+def output_file(script: str, cwd: str) -> Optional[str]:
+    """Best guess at the jobs_*.json a scraper writes, from the literal in its source."""
+    try:
+        with open(script, encoding="utf-8") as f:
+            m = OUTPUT_RE.search(f.read())
+    except OSError:
+        return None
+    if not m:
+        return None
+    rel = m.group(1)
+    for candidate in (os.path.join(cwd, rel), os.path.join(PUBLIC_DIR, os.path.basename(rel))):
+        if os.path.exists(candidate):
+            return candidate
+    return os.path.join(cwd, rel)
+
+
+def count_jobs(path: Optional[str], since: float):
+    """(jobs, bytes) for an output file written during this run, else (None, None)."""
+    if not path or not os.path.exists(path) or os.path.getmtime(path) < since:
+        return None, None
+    size = os.path.getsize(path)
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        return (len(data) if isinstance(data, list) else None), size
+    except Exception:
+        return None, size
+
+
+def kill_group(proc: subprocess.Popen):
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except Exception:
+        proc.kill()
+
+
+def by_output(scripts: List[str], cwd: str) -> List[List[str]]:
+    """Scripts grouped by output file name (given order kept); each group must run serially."""
+    groups: Dict[str, List[str]] = {}
+    for s in scripts:
+        out = output_file(s, cwd)
+        groups.setdefault(os.path.basename(out) if out else s, []).append(s)
+    return list(groups.values())
+
+
+def run_scraper(script: str, cwd: str, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Dict:
+    started_wall = time.time()
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, script],
+        cwd=cwd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,   # own process group, so kill takes chromedriver/Chrome too
+    )
+    timed_out = False
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        timed_out = True
+        kill_group(proc)
+        stdout, stderr = proc.communicate()
+
+    jobs, out_bytes = count_jobs(output_file(script, cwd), started_wall)
+    return {
+        "scraper": os.path.basename(script),
+        "duration": round(time.monotonic() - started, 2),
+        "exit_code": proc.returncode,
+        "timed_out": timed_out,
+        "jobs": jobs,
+        "output_bytes": out_bytes,
+        "stdout": stdout or "",
+        "stderr": stderr or "",
+    }
+
+
+def print_result(r: Dict):
+    print(f"▶️ {r['scraper']} ({r['duration']}s)")
+    if r["stdout"]:
+        print(r["stdout"])
+    if r["stderr"]:
+        print("⚠️ Errors:")
+        print(r["stderr"])
+    if r["timed_out"]:
+        print("⏱️ Timed out, killed")
+    print("----------------------------------------------------")
+
+
+def print_summary(results: List[Dict], wall: float):
+    print(f"{'scraper':<36} {'secs':>7} {'exit':>5} {'jobs':>5} {'bytes':>8}")
+    for r in sorted(results, key=lambda r: r["duration"], reverse=True):
+        code = "T/O" if r["timed_out"] else r["exit_code"]
+        jobs = "-" if r["jobs"] is None else r["jobs"]
+        size = "-" if r["output_bytes"] is None else r["output_bytes"]
+        print(f"{r['scraper']:<36} {r['duration']:>7} {code!s:>5} {jobs!s:>5} {size!s:>8}")
+    serial = sum(r["duration"] for r in results)
+    print(f"\nWall time {wall:.1f}s (sum of scrapers {serial:.1f}s)")
+
+
+def write_report(results: List[Dict], wall: float, path: str, extra: Optional[Dict] = None):
+    report = {
+        "finished": datetime.utcnow().strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "wall_seconds": round(wall, 2),
+        "scrapers": [{k: v for k, v in r.items() if k not in ("stdout", "stderr")} for r in results],
+    }
+    report.update(extra or {})
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"📝 Run report → {path}")
+
+
+def run_many(scripts: List[str], cwd: str, jobs: int = 1, timeout: Optional[float] = DEFAULT_TIMEOUT,
+             report_path: Optional[str] = REPORT_FILE) -> List[Dict]:
+    started = time.monotonic()
+    results = []
+    groups = by_output(scripts, cwd)
+    for g in groups:
+        if len(g) > 1:
+            print(f"🔗 same output file, run one at a time: {', '.join(os.path.basename(s) for s in g)}")
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        futures = [pool.submit(lambda g: [run_scraper(s, cwd, timeout) for s in g], g) for g in groups]
+        for fut in as_completed(futures):
+            for r in fut.result():
+                print_result(r)
+                results.append(r)
+    # keep the report in the order scripts were given
+    order = {os.path.basename(s): i for i, s in enumerate(scripts)}
+    results.sort(key=lambda r: order.get(r["scraper"], 0))
+
+    wall = time.monotonic() - started
+    print_summary(results, wall)
+    if report_path:
+        write_report(results, wall, report_path)
+    return results
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description="Run scraper_*.py scripts")
+    p.add_argument("--jobs", "-j", type=int, default=1, help="scrapers to run at once (default 1)")
+    p.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                   help=f"per-scraper wall-clock limit in seconds (default {DEFAULT_TIMEOUT})")
+    p.add_argument("--report", default=REPORT_FILE, help="where to write the JSON run report")
+    return p.parse_args(argv)
@@ -1,26 +1,14 @@
 import json
+import os
+import sys
 import time
 import re
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 
-
-def classify_type(title):
-    t = title.lower()
-    if any(k in t for k in ["policy", "analyst", "research", "economist"]):
-        return "Policy"
-    if any(k in t for k in ["communications", "social media", "editor", "writer", "podcast"]):
-        return "Communications"
-    if any(k in t for k in ["legal", "attorney", "counsel", "litigation"]):
-        return "Legal"
-    if any(k in t for k in ["government affairs", "lobby", "relations"]):
-        return "Government Affairs"
-    if any(k in t for k in ["media", "press"]):
-        return "Media"
-    if any(k in t for k in ["development", "operations", "manager", "coordinator", "assistant"]):
-        return "Operations"
-    return "Other"
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from job_types import classify
 
 
 def scrape_afpi():
@@ -47,7 +35,7 @@ def scrape_afpi():
             "title": title,
             "organization": "America First Policy Institute",
             "location": location,
-            "type": classify_type(title),
+            "type": classify(title),
             "link": link
         })
 
@@ -1,58 +1,48 @@
 import json
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-
-
-def classify_type(title):
-    t = title.lower()
-    if any(k in t for k in ["policy", "analyst", "research", "fellow"]):
-        return "Policy"
-    if any(k in t for k in ["communications", "writer", "editor"]):
-        return "Communications"
-    if any(k in t for k in ["legal", "attorney"]):
-        return "Legal"
-    if "media" in t:
-        return "Media"
-    if any(k in t for k in ["development", "manager", "coordinator"]):
-        return "Operations"
-    return "Other"
+import os
+import sys
+from urllib.parse import urljoin
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import tiered_fetch
+from job_types import classify
 
-def scrape_cei():
-    url = "https://cei.org/about/internships-jobs-and-fellowships/"
-    options = Options()
-    options.add_argument("--headless")
-    driver = webdriver.Chrome(options=options)
+URL = "https://cei.org/about/internships-jobs-and-fellowships/"
+# links in the page body only: a bare "a" matches block pages and the site menu too
+LISTING = ".entry-content a[href]"
+
+
+def scrape():
+    # WordPress page, so the static HTML normally has the listing; Chrome is the fallback
+    return tiered_fetch.fetch("cei", URL, LISTING, extract)
 
-    driver.get(url)
-    time.sleep(3)
 
+def extract(soup):
     jobs = []
-    items = driver.find_elements(By.CSS_SELECTOR, "a")
+    items = soup.select(LISTING)
 
     for i in items:
-        text = i.text.strip()
+        text = i.get_text(" ", strip=True)
         if not text:
             continue
         if "Apply" in text or "Intern" in text or "Director" in text or "Fellow" in text:
-            try:
-                link = i.get_attribute("href")
-                title = text
-                location = "Washington, DC"
-            except:
-                continue
+            link = urljoin(URL, i.get("href", ""))
+            title = text
+            location = "Washington, DC"
 
             jobs.append({
                 "title": title,
                 "organization": "Competitive Enterprise Institute",
                 "location": location,
-                "type": classify_type(title),
+                "type": classify(title),
                 "link": link
             })
 
-    driver.quit()
+    return jobs
+
+
+def scrape_cei():
+    jobs = scrape()
 
     with open("frontend/public/jobs_cei.json", "w") as f:
         json.dump(jobs, f, indent=2)
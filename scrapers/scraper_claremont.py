@@ -1,53 +1,41 @@
 import json
-import time
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-
-
-def classify_type(title):
-    t = title.lower()
-    if any(k in t for k in ["policy", "analyst", "research", "fellow"]):
-        return "Policy"
-    if any(k in t for k in ["communications", "editor", "writer"]):
-        return "Communications"
-    if any(k in t for k in ["legal", "attorney", "counsel"]):
-        return "Legal"
-    if any(k in t for k in ["events", "operations", "manager", "coordinator"]):
-        return "Operations"
-    if "media" in t:
-        return "Media"
-    return "Other"
+import os
+import sys
+from urllib.parse import urljoin
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import tiered_fetch
+from job_types import classify
 
-def scrape_claremont():
-    url = "https://www.claremont.org/careers/"
-    options = Options()
-    options.add_argument("--headless")
-    driver = webdriver.Chrome(options=options)
+URL = "https://www.claremont.org/careers/"
+
+
+def scrape():
+    # static HTML first; Chrome only if the listing is rendered client-side
+    return tiered_fetch.fetch("claremont", URL, ".careers-listing a", extract)
 
-    driver.get(url)
-    time.sleep(3)
 
+def extract(soup):
     jobs = []
-    items = driver.find_elements(By.CSS_SELECTOR, ".careers-listing a")
+    items = soup.select(".careers-listing a")
 
     for item in items:
-        try:
-            title = item.text.strip()
-            link = item.get_attribute("href")
-        except:
-            continue
+        title = item.get_text(" ", strip=True)
+        link = urljoin(URL, item.get("href", ""))
 
         jobs.append({
             "title": title,
             "organization": "Claremont Institute",
             "location": "Claremont, CA",
-            "type": classify_type(title),
+            "type": classify(title),
             "link": link
         })
 
-    driver.quit()
+    return jobs
+
+
+def scrape_claremont():
+    jobs = scrape()
 
     with open("frontend/public/jobs_claremont.json", "w") as f:
         json.dump(jobs, f, indent=2)
@@ -1,8 +1,13 @@
 import json
+import os
+import sys
 from requests_html import HTMLSession
 from typing import List, Dict
 from datetime import datetime
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import ratelimit
+
 
 def scrape_talentmarket() -> List[Dict]:
     url = "https://talentmarket.org/job-openings/"
@@ -11,6 +16,7 @@ def scrape_talentmarket() -> List[Dict]:
     session = HTMLSession()
 
     try:
+        ratelimit.wait(url)
         response = session.get(url, timeout=30)
         response.html.render(timeout=40)  # 👈 render JavaScript
     except Exception as e:
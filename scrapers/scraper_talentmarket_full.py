@@ -1,7 +1,12 @@
 import requests
-from bs4 import BeautifulSoup
 import json
-from datetime import datetime
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import dates
+import html_parser
+import ratelimit
 
 BASE = "https://talentmarket.org/job-openings/page/{}/"
 
@@ -13,12 +18,13 @@ HEADERS = {
 def scrape_page(page_num):
     url = BASE.format(page_num)
     print("Scraping:", url)
+    ratelimit.wait(url)
     r = requests.get(url, headers=HEADERS)
     if r.status_code != 200:
         print("blocked:", r.status_code)
         return []
 
-    soup = BeautifulSoup(r.text, "html.parser")
+    soup = html_parser.parse(r.text)
     listings = soup.select("article.job-opening")
 
     jobs = []
@@ -44,7 +50,7 @@ def scrape_page(page_num):
         date_tag = article.select_one("time")
         posted = "1970-01-01"
         if date_tag:
-            posted = datetime.strptime(date_tag.get_text(strip=True), "%B %d, %Y").strftime("%Y-%m-%d")
+            posted = dates.normalize(date_tag.get("datetime") or date_tag.get_text(strip=True)) or posted
 
         jobs.append({
             "title": title,
@@ -1,26 +1,36 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
-import time, json, requests, re
+import json, os, re, sys, requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import browser_pool
+import html_parser
+import link_cache
+import page_ready
+import ratelimit
 
 BASE = "https://talentmarket.org/job-openings/"
 OUTPUT = "frontend/public/jobs_talentmarket.json"
-all_jobs = []
+CARDS = ".content-preview-card"
+CARDS_TIMEOUT = 15
 
-def get_driver():
-    o = Options()
-    o.add_argument("--headless=new")
-    o.add_argument("--disable-gpu")
-    o.add_argument("--no-sandbox")
-    o.add_argument("--window-size=1280,800")
-    return webdriver.Chrome(options=o)
+# job URL -> organization; only postings we have not seen cost a detail fetch
+ORG_CACHE = link_cache.open_cache("tm_orgs", ttl=30 * link_cache.DAY, max_entries=5000)
 
 def extract_tm_org(url):
+    org = ORG_CACHE.get(url)
+    if org:
+        return org
+    org = fetch_tm_org(url)
+    if org != "Unknown":
+        ORG_CACHE.put(url, org)
+    return org
+
+def fetch_tm_org(url):
     headers = {"User-Agent": "Mozilla/5.0"}
     try:
+        ratelimit.wait(url)
         r = requests.get(url, headers=headers, timeout=30)
         r.raise_for_status()
-        s = BeautifulSoup(r.text, "lxml")
+        s = html_parser.parse(r.text)
         title_el = s.find("h1")
         if not title_el:
             return "Unknown"
@@ -50,14 +60,28 @@ def clean_location(raw):
     t = t.replace("Location:", "").strip()
     return t if t else "N/A"
 
+def load(d, url):
+    # selenium is imported on first use, so importing this module stays cheap
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    ratelimit.wait(url)
+    page_ready.goto(d, url, selector=CARDS)
+    # page_ready gives up quietly at its timeout; don't parse a listing whose cards never rendered
+    WebDriverWait(d, CARDS_TIMEOUT).until(EC.presence_of_element_located((By.CSS_SELECTOR, CARDS)))
+
 def scrape():
-    d = get_driver()
-    d.get(BASE)
-    time.sleep(3)
+    with browser_pool.lease() as d:
+        return scrape_with(d)
+
+def scrape_with(d):
+    load(d, BASE)
+    all_jobs=[]
     seen=set()
     while True:
-        soup = BeautifulSoup(d.page_source,"lxml")
-        cards = soup.select(".content-preview-card")
+        soup = html_parser.parse(d.page_source)
+        cards = soup.select(CARDS)
         for c in cards:
             a = c.select_one("h2 a")
             if not a or not a.get("href"): continue
@@ -78,13 +102,14 @@ def scrape():
             })
         nxt = soup.find("a", string=lambda x:x and "Next" in x)
         if not nxt or not nxt.get("href"): break
-        d.get(nxt["href"])
-        time.sleep(2)
-    d.quit()
+        load(d, nxt["href"])
+    return all_jobs
 
 if __name__=="__main__":
-    scrape()
+    all_jobs = scrape()
     with open(OUTPUT,"w") as f:
         json.dump(all_jobs,f,indent=2)
+    c = ORG_CACHE.report()
+    print(f"🗄️  orgs: {c['hits']} cached, {c['misses']} detail pages fetched")
     print(f"✅ scraped",len(all_jobs),"jobs →",OUTPUT)
 
@@ -1,83 +1,148 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-import json, time, re
+import json, os, re, sys
+import requests
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+import browser_pool
+import html_parser
+import jsonld
+import page_ready
+import ratelimit
+import wp_json
+from job_types import classify
 
 BASE_URL = "https://yaf.org/careers/"
+OUTPUT = "frontend/public/jobs_yaf.json"
 
-opts = Options()
-opts.add_argument("--headless")
-opts.add_argument("--no-sandbox")
-opts.add_argument("--disable-dev-shm-usage")
-
-driver = webdriver.Chrome(options=opts)
-driver.get(BASE_URL)
-time.sleep(4)
-
-jobs, seen = [], set()
-
-# collect links
-for a in driver.find_elements(By.CSS_SELECTOR, "a[href*='/careers/']"):
-    href = a.get_attribute("href")
-    if href and href.startswith(BASE_URL) and href not in seen and not href.endswith("careers/"):
-        seen.add(href)
-        title = a.text.strip()
-        if title and len(title) > 2:
-            jobs.append({
-                "title": title,
-                "organization": "Young America's Foundation",
-                "location": "N/A",
-                "type": "N/A",
-                "link": href
-            })
-
-print(f"🧾 Found {len(jobs)} YAF job links")
-
-# process each job page
-for job in jobs:
+# plugin_host.py swaps in its shared, pooled session
+session = requests.Session()
+
+
+def collect_links(driver):
+    from selenium.webdriver.common.by import By   # browser path only
+    page_ready.goto(driver, BASE_URL, selector="a[href*='/careers/']")
+
+    jobs, seen = [], set()
+
+    # collect links
+    for a in driver.find_elements(By.CSS_SELECTOR, "a[href*='/careers/']"):
+        href = a.get_attribute("href")
+        if href and href.startswith(BASE_URL) and href not in seen and not href.endswith("careers/"):
+            seen.add(href)
+            title = a.text.strip()
+            if title and len(title) > 2:
+                jobs.append({
+                    "title": title,
+                    "organization": "Young America's Foundation",
+                    "location": "N/A",
+                    "type": "N/A",
+                    "link": href
+                })
+
+    print(f"🧾 Found {len(jobs)} YAF job links")
+    return jobs
+
+
+def process_job(driver, job):
+    from selenium.webdriver.common.by import By
     try:
-        driver.get(job["link"])
-        time.sleep(2)
-        text = driver.find_element(By.TAG_NAME, "body").text
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-
-        # --- LOCATION ---
-        for l in lines:
-            if re.search(r"[A-Z][a-zA-Z\s]+,\s?(?:[A-Z]{2}|[A-Z][a-z]+)$", l):
-                job["location"] = l.strip()
-                break
-
-        # --- TYPE (job category) ---
-        lower = text.lower()
-
-        if any(k in lower for k in ["policy", "research", "legislative", "analysis"]):
-            job["type"] = "Policy"
-        elif any(k in lower for k in ["development", "fundraising", "donor", "philanthropy"]):
-            job["type"] = "Development"
-        elif any(k in lower for k in ["communication", "media", "press", "public relations", "marketing", "journalism"]):
-            job["type"] = "Communications"
-        elif any(k in lower for k in ["education", "student", "teacher", "school", "campus"]):
-            job["type"] = "Education"
-        elif any(k in lower for k in ["event", "conference", "program", "outreach"]):
-            job["type"] = "Programs"
-        elif any(k in lower for k in ["finance", "accounting", "operations", "administration"]):
-            job["type"] = "Operations"
-        elif any(k in lower for k in ["graphic", "design", "creative", "digital", "video"]):
-            job["type"] = "Creative / Digital"
+        # body text is read whole, so wait for it to stop changing
+        page_ready.goto(driver, job["link"], condition=page_ready.DOM_STABLE, timeout=8)
+        posting = jsonld.extract(driver.page_source)
+        if posting:
+            apply_posting(job, posting)
         else:
-            job["type"] = "N/A"
-
+            apply_details(job, driver.find_element(By.TAG_NAME, "body").text)
         print(f"✅ {job['title']} | {job['location']} | {job['type']}")
 
     except Exception as e:
         print(f"⚠️ Error on {job['link']}: {e}")
 
-driver.quit()
-
-# save
-out = "frontend/public/jobs_yaf.json"
-with open(out, "w", encoding="utf-8") as f:
-    json.dump(jobs, f, indent=2)
-
-print(f"\n✅ Saved {len(jobs)} YAF jobs to {out}")
 
+def fetch_posting(job):
+    """The posting's JSON-LD JobPosting over plain HTTP (no browser), or None."""
+    try:
+        ratelimit.wait(job["link"])
+        r = session.get(job["link"], headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
+    except requests.RequestException:
+        return None
+    return jsonld.extract(r.content) if r.ok else None
+
+
+def apply_posting(job, posting):
+    """Fill location / type / date from a schema.org JobPosting."""
+    job["location"] = posting["location"] or job["location"]
+    job["type"] = classify(job["title"], posting["description"], default="N/A")
+    if posting["date_posted"]:
+        job["date_posted"] = posting["date_posted"]
+
+
+def apply_details(job, text):
+    """Fill location / type from a posting's text (one line per block)."""
+    lines = [l.strip() for l in text.splitlines() if l.strip()]
+
+    # --- LOCATION ---
+    for l in lines:
+        if re.search(r"[A-Z][a-zA-Z\s]+,\s?(?:[A-Z]{2}|[A-Z][a-z]+)$", l):
+            job["location"] = l.strip()
+            break
+
+    # --- TYPE (job category): the title decides, the body breaks ties ---
+    job["type"] = classify(job["title"], text, default="N/A")
+
+def scrape_api():
+    """Postings from yaf.org's REST API, or None when it is not exposed."""
+    posts = wp_json.jobs(session, BASE_URL)
+    if not posts:
+        return None
+
+    jobs = []
+    for post in posts:
+        job = {
+            "title": post["title"],
+            "organization": "Young America's Foundation",
+            "location": post["location"] or "N/A",
+            "type": "N/A",
+            "link": post["link"]
+        }
+        apply_details(job, html_parser.parse(post["html"]).get_text("\n"))
+        if post["location"]:
+            job["location"] = post["location"]
+        jobs.append(job)
+
+    print(f"🧾 Found {len(jobs)} YAF jobs via the REST API")
+    return jobs
+
+
+def scrape():
+    # no browser at all when the REST API answers
+    jobs = scrape_api()
+    if jobs is not None:
+        return jobs
+
+    # one pooled browser for the listing and every detail page
+    with browser_pool.lease() as driver:
+        jobs = collect_links(driver)
+
+        # process each job page; postings with JSON-LD need no browser
+        # navigation (the first page without it switches that off: same template)
+        structured = True
+        for job in jobs:
+            posting = fetch_posting(job) if structured else None
+            if posting:
+                apply_posting(job, posting)
+                print(f"✅ {job['title']} | {job['location']} | {job['type']} (JSON-LD)")
+                continue
+            structured = False
+            process_job(driver, job)
+
+    return jobs
+
+
+if __name__ == "__main__":
+    jobs = scrape()
+
+    # save
+    with open(OUTPUT, "w", encoding="utf-8") as f:
+        json.dump(jobs, f, indent=2)
+
+    print(f"\n✅ Saved {len(jobs)} YAF jobs to {OUTPUT}")
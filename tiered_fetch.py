@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Tiered fetch: only start a browser when nothing cheaper works.
+
+fetch(site, url, selector, parse, api=...) tries, in order:
+1. "api"     - a known JSON endpoint (callable returning jobs, or None/[] to pass)
+2. "static"  - plain GET of `url`; used when `selector` matches the raw HTML
+3. "browser" - a pooled Chrome tab (browser_pool + page_ready), then the same
+               `parse` runs over the rendered DOM
+
+`parse(soup)` gets a BeautifulSoup document in both HTML tiers, so one parser
+serves both. The tier that produced each site's jobs is recorded, printed at
+exit and kept in .cache/fetch_tiers.json (tiers()/report() for the numbers).
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+from bs4 import BeautifulSoup
+
+import html_parser
+
+API = "api"
+STATIC = "static"
+BROWSER = "browser"
+
+TIERS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "fetch_tiers.json")
+
+_tiers: Dict[str, Dict] = {}
+_lock = threading.Lock()
+
+
+def _record(site: str, tier: Optional[str], jobs: int, started: float):
+    with _lock:
+        _tiers[site] = {"tier": tier, "jobs": jobs, "seconds": round(time.monotonic() - started, 2)}
+
+
+def _static_soup(url: str) -> Optional[BeautifulSoup]:
+    from scraper import safe_get   # shared session: rate limits + conditional cache
+    r = safe_get(url)
+    return html_parser.parse(r.text) if r is not None else None
+
+
+def _browser_soup(url: str, selector: Optional[str]) -> BeautifulSoup:
+    import browser_pool
+    import page_ready
+    with browser_pool.lease() as driver:
+        page_ready.goto(driver, url, selector=selector)
+        return html_parser.parse(driver.page_source)
+
+
+def fetch(site: str, url: Optional[str], selector: Optional[str],
+          parse: Callable[[BeautifulSoup], List[Dict]],
+          api: Optional[Callable[[], Optional[List[Dict]]]] = None) -> List[Dict]:
+    started = time.monotonic()
+
+    if api is not None:
+        try:
+            jobs = api()
+        except Exception as e:
+            print(f"⚠️ {site}: API tier failed: {e}")
+            jobs = None
+        if jobs:
+            _record(site, API, len(jobs), started)
+            return jobs
+
+    if url and selector:
+        soup = _static_soup(url)
+        if soup is not None and soup.select_one(selector) is not None:
+            jobs = parse(soup)
+            _record(site, STATIC, len(jobs), started)
+            return jobs
+
+    if url:
+        jobs = parse(_browser_soup(url, selector))
+        _record(site, BROWSER, len(jobs), started)
+        return jobs
+
+    _record(site, None, 0, started)
+    return []
+
+
+def tiers() -> Dict[str, Dict]:
+    with _lock:
+        return {site: dict(t) for site, t in _tiers.items()}
+
+
+def report() -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for t in tiers().values():
+        counts[t["tier"] or "none"] = counts.get(t["tier"] or "none", 0) + 1
+    return counts
+
+
+@atexit.register
+def save():
+    current = tiers()
+    if not current:
+        return
+    try:
+        with open(TIERS_FILE, encoding="utf-8") as f:
+            known = json.load(f)
+    except (OSError, ValueError):
+        known = {}
+    known.update(current)
+    os.makedirs(os.path.dirname(TIERS_FILE), exist_ok=True)
+    with open(TIERS_FILE, "w", encoding="utf-8") as f:
+        json.dump(known, f, indent=2, sort_keys=True)
+    for site, t in sorted(current.items()):
+        print(f"🪜 {site}: {t['tier'] or 'no tier'} ({t['jobs']} jobs, {t['seconds']}s)")
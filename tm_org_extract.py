@@ -1,5 +1,22 @@
+from typing import Optional, Union
+
 from bs4 import BeautifulSoup
 
+import html_parser
+import jsonld
+
+
+def org_from_html(markup: Union[str, bytes]) -> Optional[str]:
+    """
+    hiringOrganization from the page's JSON-LD JobPosting (no DOM parse);
+    get_tm_org()'s "About the" heuristic only when there is none.
+    """
+    posting = jsonld.extract(markup)
+    if posting and posting["organization"]:
+        return posting["organization"]
+    return get_tm_org(html_parser.parse(markup, label="tm detail"))
+
+
 def get_tm_org(soup: BeautifulSoup) -> str:
     """
     Extract Talent Market org name cleanly and remove the 'About the' prefix.
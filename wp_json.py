@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+WordPress REST API (wp-json) adapter for WordPress careers sites.
+
+One JSON request per 100 postings instead of a rendered listing page plus a
+detail page per job:
+- posts(session, site, rest_base): every item of a post type, per_page=100,
+  `_fields=` to trim the payload, pages 2..X-WP-TotalPages fetched concurrently
+- find_rest_base(session, site): the job-like post type (job, jobs, career,
+  job-listings, ...) from /wp-json/wp/v2/types, remembered for a week
+- summarize(post): title / link / date / location / organization / text / html
+  pulled from the usual core + ACF fields, for each scraper to map into its schema
+
+Everything returns None when the site does not expose the API, so callers
+can fall back to their HTML path. Requests go through `session` (after
+ratelimit.wait) unless a `fetch(url)` is given (e.g. scraper.safe_get, for
+its conditional cache too); query strings are built into the URL either way.
+"""
+
+import html
+import re
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlencode
+
+import requests
+
+import link_cache
+import paginate
+import ratelimit
+
+PER_PAGE = 100
+TIMEOUT = 20
+FIELDS = "id,date,link,title,content,excerpt,acf,meta"
+JOB_TYPE_HINTS = ("job", "career", "position", "opening", "vacanc")
+
+LOCATION_KEYS = ("location", "job_location", "city", "position_location")
+ORG_KEYS = ("company", "company_name", "organization", "organisation", "employer")
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+# fetch(url) -> Response, or None on failure
+Fetch = Callable[[str], Optional[requests.Response]]
+
+# site -> rest_base of its job post type ("" = site has none / no API)
+TYPES = link_cache.open_cache("wp_types", ttl=7 * link_cache.DAY, max_entries=500)
+
+
+def api_root(site: str) -> str:
+    m = re.match(r"(https?://[^/]+)", site)
+    return f"{m.group(1) if m else site.rstrip('/')}/wp-json/wp/v2"
+
+
+def text(value) -> str:
+    """Plain text from a rendered field ({"rendered": "..."} or a string)."""
+    if isinstance(value, dict):
+        value = value.get("rendered", "")
+    return " ".join(html.unescape(TAG_RE.sub(" ", value or "")).split())
+
+
+def _get(session: requests.Session, url: str, params: Dict,
+         fetch: Optional[Fetch] = None) -> Optional[requests.Response]:
+    url = f"{url}?{urlencode(params)}"
+    try:
+        if fetch:
+            r = fetch(url)
+        else:
+            ratelimit.wait(url)
+            r = session.get(url, timeout=TIMEOUT)
+    except requests.RequestException:
+        return None
+    if r is None or r.status_code != 200 or "json" not in r.headers.get("Content-Type", ""):
+        return None
+    return r
+
+
+def find_rest_base(session: requests.Session, site: str, fetch: Optional[Fetch] = None) -> Optional[str]:
+    cached = TYPES.get(site)
+    if cached is not None:
+        return cached or None
+
+    r = _get(session, f"{api_root(site)}/types", {"_fields": "slug,rest_base"}, fetch)
+    if r is None:
+        return None   # not remembered: may be a transient failure
+    try:
+        types = r.json()
+    except ValueError:
+        types = {}
+    found = ""
+    for slug, t in (types.items() if isinstance(types, dict) else []):
+        if any(h in slug.lower() for h in JOB_TYPE_HINTS):
+            found = (t or {}).get("rest_base") or slug
+            break
+    TYPES.put(site, found)
+    return found or None
+
+
+def posts(session: requests.Session, site: str, rest_base: str, params: Optional[Dict] = None,
+          fields: str = FIELDS, workers: int = 4, fetch: Optional[Fetch] = None) -> Optional[List[Dict]]:
+    """All items of `rest_base`, or None when the endpoint is not there."""
+    url = f"{api_root(site)}/{rest_base}"
+    query = {"per_page": PER_PAGE, "_fields": fields, **(params or {})}
+
+    first = _get(session, url, {**query, "page": 1}, fetch)
+    if first is None:
+        return None
+    try:
+        items = first.json()
+    except ValueError:
+        return None
+    if not isinstance(items, list):
+        return None
+
+    try:
+        total = int(first.headers.get("X-WP-TotalPages", "1"))
+    except ValueError:
+        total = 1
+
+    def fetch_page(page):
+        r = _get(session, url, {**query, "page": page}, fetch)
+        try:
+            return r.json() if r is not None else []
+        except ValueError:
+            return []
+
+    pages = {1: items}
+    for page, batch in paginate.stream(fetch_page, range(2, total + 1), workers=workers):
+        pages[page] = batch if isinstance(batch, list) else []
+    return [item for page in sorted(pages) for item in pages[page]]
+
+
+def summarize(post: Dict) -> Dict:
+    acf = post.get("acf") if isinstance(post.get("acf"), dict) else {}
+    meta = post.get("meta") if isinstance(post.get("meta"), dict) else {}
+    fields = {**meta, **acf}
+    content = post.get("content")
+
+    def first_of(keys):
+        for k in keys:
+            v = fields.get(k)
+            if isinstance(v, str) and v.strip():
+                return v.strip()
+        return None
+
+    return {
+        "title": text(post.get("title")),
+        "link": post.get("link") or "",
+        "date": (post.get("date") or "").split("T")[0] or None,
+        "location": first_of(LOCATION_KEYS),
+        "organization": first_of(ORG_KEYS),
+        "text": text(post.get("content")) or text(post.get("excerpt")),
+        "html": content.get("rendered", "") if isinstance(content, dict) else (content or ""),
+    }
+
+
+def jobs(session: requests.Session, site: str, rest_base: Optional[str] = None,
+         params: Optional[Dict] = None, fetch: Optional[Fetch] = None) -> Optional[List[Dict]]:
+    """summarize()d job posts of `site`; None when there is no usable API."""
+    rest_base = rest_base or find_rest_base(session, site, fetch)
+    if not rest_base:
+        return None
+    items = posts(session, site, rest_base, params, fetch=fetch)
+    if items is None:
+        return None
+    return [summarize(p) for p in items]